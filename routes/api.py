@@ -146,7 +146,7 @@ def api_games(scraper: BaseScraper) -> Any:
     return jsonify({
         "status": "success",
         "site": scraper.site_id,
-        "games": games,
+        "games": [game.to_dict() for game in games],
         "has_next": has_next,
         "current_page": page
     })
@@ -184,7 +184,7 @@ def api_game(scraper: BaseScraper) -> Any:
         "screenshots": screenshots,
         "download_links": downloads,
         "download_password": password,
-        "related_games": related
+        "related_games": [game.to_dict() for game in related]
     })
 
 
@@ -208,7 +208,7 @@ def api_search(scraper: BaseScraper) -> Any:
         "status": "success",
         "site": scraper.site_id,
         "query": query,
-        "results": games
+        "results": [game.to_dict() for game in games]
     })
 
 
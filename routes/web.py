@@ -2,8 +2,8 @@
 from flask import Blueprint, request, render_template, redirect, url_for, current_app, abort
 import logging
 from typing import Optional, Any, Dict, List, Tuple, Set
-from scrapers import ScraperFactory, BaseScraper
-import asyncio
+from scrapers import ScraperFactory, BaseScraper, GameCard
+from concurrent.futures import ThreadPoolExecutor
 import re # Import re for normalization
 
 logger = logging.getLogger(__name__)
@@ -33,7 +33,7 @@ def view_games_all(page: int) -> Any:
     dark_mode: str = request.cookies.get('dark_mode', 'false')
     site_info = _get_site_info()
     all_scrapers = _get_all_scrapers()
-    all_games: List[Dict[str, Any]] = []
+    all_games: List[GameCard] = []
     errors: List[str] = []
     overall_has_next = False
     default_site_id = current_app.config.get('DEFAULT_SITE', 'gamepciso')
@@ -45,7 +45,7 @@ def view_games_all(page: int) -> Any:
             if has_next: overall_has_next = True
             logger.info(f"Fetched {len(games)} games from {site_id}. Has Next: {has_next}")
             
-            all_games.sort(key=lambda g: (g.get('title') or '').lower())
+            all_games.sort(key=lambda g: (g.title or '').lower())
             return render_template('index.html',
                                    games=all_games, page=page, has_next=overall_has_next,
                                    categories=[], current_category=None, dark_mode=dark_mode,
@@ -59,7 +59,7 @@ def view_games_all(page: int) -> Any:
                                    site='all', # Indicate 'all' mode even for error
                                    sites=site_info,
                                    default_site_id=default_site_id)
-    all_games.sort(key=lambda g: (g.get('title') or '').lower())
+    all_games.sort(key=lambda g: (g.title or '').lower())
     return render_template('index.html', games=all_games, page=page, has_next=overall_has_next, categories=[], current_category=None, dark_mode=dark_mode, site='all', sites=site_info, fetch_errors=errors)
 
 @web_bp.route('/game')
@@ -108,15 +108,24 @@ def search() -> Any:
     if not query: return redirect(url_for('web.view_games_all', page=1))
 
     all_scrapers = _get_all_scrapers()
-    raw_results: List[Dict[str, Any]] = []
+    raw_results: List[GameCard] = []
     errors: List[str] = []
 
     # --- Step 1: Fetch results from all scrapers ---
-    # (Could be parallelized with asyncio for better performance)
-    for site_id, scraper in all_scrapers.items():
-        try:
+    # Sites are searched concurrently (each search is a network round trip); results are merged in site order.
+    # Workers need the app context: BaseScraper reads the proxy settings from current_app.config
+    app = current_app._get_current_object()
+    def run_search(scraper: BaseScraper) -> List[GameCard]:
+        with app.app_context(): return scraper.search_games(query)
+    with ThreadPoolExecutor(max_workers=max(1, len(all_scrapers))) as pool:
+        futures = {}
+        for site_id, scraper in all_scrapers.items():
             logger.info(f"Searching {site_id} for '{query}'...")
-            results = scraper.search_games(query)
+            futures[site_id] = pool.submit(run_search, scraper)
+    for site_id, future in futures.items():
+        scraper = all_scrapers[site_id]
+        try:
+            results = future.result()
             logger.info(f"Found {len(results)} raw results from {site_id}.")
             raw_results.extend(results) # Add site info which is done by _format_game_data
         except NotImplementedError:
@@ -140,9 +149,9 @@ def search() -> Any:
         norm = re.sub(r'\s+', ' ', norm).strip() # Collapse again
         return norm
 
-    grouped_results: Dict[str, List[Dict[str, Any]]] = {}
+    grouped_results: Dict[str, List[GameCard]] = {}
     for game in raw_results:
-        original_title = game.get('title')
+        original_title = game.title
         if not original_title: continue # Skip games without titles
 
         norm_title = normalize_title(original_title)
@@ -153,9 +162,9 @@ def search() -> Any:
         grouped_results[norm_title].append(game)
 
     # --- Step 3: Score and Sort Groups ---
-    def score_match(game_title: str, query: str) -> int:
+    def score_match(game: GameCard, query: str) -> int:
         score = 0
-        title_lower = game_title.lower()
+        title_lower = (game.title or '').lower()
         query_lower = query.lower()
         if query_lower == title_lower:
             score += 100 # Perfect match
@@ -165,37 +174,35 @@ def search() -> Any:
                 score += 20 # Starts with query is better
         # Add more scoring logic if needed (e.g., word matching, TF-IDF)
         # Bonus for having an image
-        if game.get('image'):
+        if game.image:
              score += 5
         return score
 
-    scored_groups: List[Tuple[int, str, List[Dict[str, Any]]]] = []
+    # Scores live next to the cards as (score, game) pairs; GameCard is slotted and has no score field
+    scored_groups: List[Tuple[int, str, List[Tuple[int, GameCard]]]] = []
     query_norm = query.lower()
     for norm_title, games_in_group in grouped_results.items():
-        best_score_in_group = 0
-        for game in games_in_group:
-             current_score = score_match(game.get('title', ''), query_norm)
-             best_score_in_group = max(best_score_in_group, current_score)
-             game['score'] = current_score # Store score for potential later use
+        scored_games = [(score_match(game, query_norm), game) for game in games_in_group]
+        best_score_in_group = max(score for score, _ in scored_games)
 
         # Only include groups where at least one title actually contains the query
         if best_score_in_group > 0:
              # Sort games within the group by score (desc) then title (asc)
-             games_in_group.sort(key=lambda g: (-g.get('score', 0), (g.get('title') or '').lower()))
-             scored_groups.append((best_score_in_group, norm_title, games_in_group))
+             scored_games.sort(key=lambda item: (-item[0], (item[1].title or '').lower()))
+             scored_groups.append((best_score_in_group, norm_title, scored_games))
 
     # Sort groups by the best score within them (descending), then alphabetically
     scored_groups.sort(key=lambda item: (-item[0], item[1]))
 
     # --- Step 4: Prepare final list (e.g., take the best entry from each group) ---
-    final_results: List[Dict[str, Any]] = []
+    final_results: List[Tuple[int, GameCard]] = []
     MAX_RESULTS = 50 # Limit total results shown
-    for score, norm_title, games_in_group in scored_groups:
-        if not games_in_group: continue
+    for score, norm_title, scored_games in scored_groups:
+        if not scored_games: continue
         # Select the best scored game from the group (already sorted)
-        best_game = games_in_group[0]
+        best_game = scored_games[0]
         # Optional: Add other sources to the best game entry if needed for display
-        # best_game['other_sources'] = games_in_group[1:]
+        # other_sources = [game for _, game in scored_games[1:]]
         final_results.append(best_game)
         if len(final_results) >= MAX_RESULTS:
              break
@@ -203,9 +210,9 @@ def search() -> Any:
     logger.info(f"Processed {len(raw_results)} raw results into {len(final_results)} de-duplicated & sorted results for query '{query}'.")
 
     try:
-        final_results.sort(key=lambda g: (-g.get('score', 0), (g.get('title') or '').lower()))
+        final_results.sort(key=lambda item: (-item[0], (item[1].title or '').lower()))
         return render_template('search.html',
-                               games=final_results, query=query, dark_mode=dark_mode,
+                               games=[game for _, game in final_results], query=query, dark_mode=dark_mode,
                                site='all', sites=site_info, fetch_errors=errors,
                                default_site_id=default_site_id) # Pass default
     except Exception as e:
@@ -1,24 +1,26 @@
 # scrapers/__init__.py
+import importlib
 import logging
 
 logger = logging.getLogger(__name__)
 
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, GameCard
 from .scraper_factory import ScraperFactory
 
-try:
-    from . import ovagames_scraper
-except ImportError as e:
-    logger.warning(f"Could not import ovagames_scraper module: {e}")
-
-try:
-    from . import gamepciso_scraper
-except ImportError as e:
-    logger.warning(f"Could not import gamepciso_scraper module: {e}")
+# Site scraper modules (ovagames_scraper, gamepciso_scraper, ...) are not imported here: ScraperFactory
+# discovery imports them when the first factory is built, and attribute access below loads one on demand
+def __getattr__(name: str):
+    if name.endswith('_scraper'):
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}": raise # A missing dependency inside an existing module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Removed reference to alternate_site_scraper
 
 __all__ = [
     'BaseScraper',
+    'GameCard',
     'ScraperFactory',
-]
\ No newline at end of file
+]
@@ -2,13 +2,24 @@
 Base scraper class for the GameStore application.
 """
 import requests
-from bs4 import BeautifulSoup, Tag
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from bs4.dammit import EncodingDetector
+import soupsieve as sv
+import codecs
+import functools
+import hashlib
 import logging
 import os
+import pickle
+import threading
 import time
 from urllib.parse import urlparse, urljoin
-from typing import Optional, Dict, Any, List, Union
+import re
+from collections import OrderedDict, deque
+from typing import Optional, Dict, Any, List, Union, Callable, TypeVar, Deque
 import random # Keep random for potential use later if needed
+from dataclasses import dataclass
 from flask import current_app # Import current_app to access config
 
 # --- NEW: Import and initialize colorama ---
@@ -28,9 +39,106 @@ except ImportError:
     logging.warning("Colorama not installed, proxy status colors will be disabled.")
 # -----------------------------------------
 
+# Prefer the C-based lxml tree builder; html.parser is pure Python and dominates parse time
+try:
+    import lxml.html as lxml_html
+    HTML_PARSER = 'lxml'
+    # _fetch_html returns UTF-8 bytes; without an explicit encoding libxml2 falls back to Latin-1
+    # for pages that carry no <meta charset>
+    UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+except ImportError:
+    lxml_html = None
+    UTF8_HTML_PARSER = None
+    HTML_PARSER = 'html.parser'
+    logging.warning("lxml not installed, falling back to the slower html.parser.")
+# -----------------------------------------
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+# Bump when a scraper's parse output changes shape, so stale pickled results are never reused
+PARSED_CACHE_VERSION = 2
+PARSED_MEMORY_CACHE_SIZE = 256
+
+# One pooled, keep-alive HTTP session for every scraper instance, created on first use: repeat fetches
+# from the same host reuse open connections instead of paying a TCP/TLS handshake each time.
+# Retries stay in _fetch_html (max_retries=0), so urllib3 does not multiply the attempts
+_SESSION_LOCK = threading.Lock()
+_SHARED_SESSION: Optional[requests.Session] = None
+
+def _shared_session() -> requests.Session:
+    global _SHARED_SESSION
+    with _SESSION_LOCK:
+        if _SHARED_SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0)
+            session.mount('http://', adapter); session.mount('https://', adapter)
+            _SHARED_SESSION = session
+        return _SHARED_SESSION
+
+# Parsed soups are large; keep only the most recent few per scraper
+SOUP_MEMORY_CACHE_SIZE = 32
+
+@dataclass(slots=True)
+class GameCard:
+    """
+    A game entry as listed on listing, search and related-games sections.
+    Slotted to keep per-card memory low; templates read it by attribute and
+    JSON responses serialize it with to_dict.
+    """
+    title: str
+    url: str
+    image: Optional[str] = None
+    description: Optional[str] = None
+    release_date: Optional[str] = None
+    site: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        """Plain dict of the card's fields (same keys as dataclasses.asdict, without its recursive deep copy)."""
+        return {"title": self.title, "url": self.url, "image": self.image, "description": self.description,
+                "release_date": self.release_date, "site": self.site}
+
+_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([^"\';\s]+)', re.I)
+
+def to_utf8(raw: bytes, content_type: Optional[str] = None) -> bytes:
+    """
+    Re-encode a fetched page as UTF-8, so every parser can be told the encoding up front.
+    The source charset is, in order: the Content-Type header's charset, a byte-order mark,
+    the page's own <meta>/XML declaration, then UTF-8 and windows-1252.
+    """
+    match = _CHARSET_RE.search(content_type or "")
+    data, bom_encoding = EncodingDetector.strip_byte_order_mark(raw)
+    candidates = (match.group(1) if match else None, bom_encoding,
+                  EncodingDetector.find_declared_encoding(data, is_html=True), 'utf-8', 'windows-1252')
+    for encoding in candidates:
+        if not encoding: continue
+        try:
+            if codecs.lookup(encoding).name == 'utf-8':
+                data.decode('utf-8'); return data # Already UTF-8: no copy needed
+            return data.decode(encoding).encode('utf-8')
+        except (LookupError, UnicodeDecodeError): continue
+    return data.decode('utf-8', errors='replace').encode('utf-8')
+
+def xpath_has_class(name: str) -> str:
+    """XPath predicate matching a whole class token, like CSS '.name'."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+class AttributeStrainer(SoupStrainer):
+    """
+    SoupStrainer that keeps the subtrees of top-level tags whose raw (name, attrs) satisfy a predicate.
+    Lets a scraper OR together class and id tests, which SoupStrainer's keyword filters AND.
+    Implements both bs4 tree-builder hooks: allow_tag_creation (4.13+) and search_tag (older releases).
+    """
+    def __init__(self, predicate: Callable[[str, Dict[str, Any]], bool]):
+        super().__init__(); self._predicate = predicate
+
+    def allow_tag_creation(self, nsprefix: Optional[str], name: str, attrs: Optional[Dict[str, Any]]) -> bool:
+        return self._predicate(name, attrs or {})
+
+    def search_tag(self, markup_name: Any = None, markup_attrs: Any = None) -> bool:
+        return self._predicate(markup_name, markup_attrs or {})
+
 class BaseScraper:
     """
     Base scraper class that defines common functionality for all scrapers.
@@ -40,6 +148,8 @@ class BaseScraper:
     site_id: Optional[str] = None
     site_name: Optional[str] = None
     site_description: Optional[str] = None
+    # Compiled soupsieve selectors by selector string, shared by every scraper (see _sel)
+    _compiled_selectors: Dict[str, Any] = {}
     
     def __init__(self, base_url: Optional[str] = None, cache_dir: Optional[str] = None, cache_timeout: int = 3600):
         self.base_url: Optional[str] = base_url or getattr(self.__class__, 'base_url', None)
@@ -52,6 +162,13 @@ class BaseScraper:
             "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1"
         }
+        self._session: requests.Session = _shared_session() # Shared across scrapers, see _shared_session
+        # Parsed entry-point results keyed by page content hash (see _cached_parse)
+        self._parsed_cache: "OrderedDict[str, Any]" = OrderedDict(); self._parsed_lock = threading.Lock()
+        # Parsed soups keyed by (url, strainer, page content hash), see _get_soup; shares _parsed_lock
+        self._soup_cache: "OrderedDict[Any, BeautifulSoup]" = OrderedDict()
+        # Per-instance memo: pages repeat the same CDN/base URLs many times over
+        self._normalize_url = functools.lru_cache(maxsize=2048)(self._normalize_url_impl)
         if self.cache_dir and not os.path.exists(self.cache_dir):
             try: os.makedirs(self.cache_dir, exist_ok=True)
             except OSError as e: logger.error(f"Failed to create cache dir {self.cache_dir}: {e}"); self.cache_dir = None
@@ -68,13 +185,15 @@ class BaseScraper:
         path_safe = "".join(c if c.isalnum() or c in ['-', '_', '.'] else '_' for c in parsed.path.replace('/', '_'))
 
         filename_base = f"{class_site_id}_{netloc_safe}{path_safe}"
+        # Stable digests (not hash(), which is salted per process), so every worker and every
+        # restart maps a URL to the same file
         if parsed.query:
-            query_hash = str(abs(hash(parsed.query)) % 1000000) 
+            query_hash = hashlib.blake2b(parsed.query.encode('utf-8'), digest_size=8).hexdigest()
             filename_base += '_' + query_hash
         
         max_len = 200 
         if len(filename_base) > max_len:
-            filename_base = filename_base[:max_len-10] + "_" + str(abs(hash(filename_base)) % 100000)
+            filename_base = filename_base[:max_len-17] + "_" + hashlib.blake2b(filename_base.encode('utf-8'), digest_size=8).hexdigest()
 
         return os.path.join(self.cache_dir, f"{filename_base}.html")
     
@@ -99,14 +218,118 @@ class BaseScraper:
                 
         return True
     
-    def _get_soup(self, url: str, force_refresh: bool = False) -> Optional[BeautifulSoup]:
+    def _get_soup(self, url: str, force_refresh: bool = False, parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+        """
+        Fetch a page and parse it with BeautifulSoup.
+        parse_only restricts tree construction to the subtrees matched by the strainer;
+        the full HTML is still written to the cache.
+        Soups for unchanged pages come from an in-process LRU instead of being re-parsed,
+        so the returned soup may be shared: treat it as read-only.
+        """
+        html_content = self._fetch_html(url, force_refresh)
+        if html_content is None: return None
+        raw = html_content if isinstance(html_content, bytes) else html_content.encode('utf-8')
+        key = (url, parse_only, hashlib.blake2b(raw, digest_size=16).digest())
+        with self._parsed_lock:
+            soup = self._soup_cache.get(key)
+            if soup is not None: self._soup_cache.move_to_end(key); return soup
+        soup = self._soup_from_html(html_content, parse_only)
+        with self._parsed_lock:
+            self._soup_cache[key] = soup; self._soup_cache.move_to_end(key)
+            while len(self._soup_cache) > SOUP_MEMORY_CACHE_SIZE: self._soup_cache.popitem(last=False)
+        return soup
+
+    def _get_tree(self, url: str, force_refresh: bool = False, parser: Optional[Any] = None) -> Optional[Any]:
+        """
+        Fetch a page and parse it into an lxml.html element tree.
+        For hot listing loops that can be expressed as precompiled XPath.
+        parser is an optional lxml.html.HTMLParser (e.g. one that drops comments) to build a leaner tree;
+        build it with encoding='utf-8' to match the bytes _fetch_html returns.
+        """
+        html_content = self._fetch_html(url, force_refresh)
+        if html_content is None: return None
+        return self._tree_from_html(html_content, parser, url)
+
+    def _soup_from_html(self, html_content: Union[str, bytes], parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Parse already-fetched markup with BeautifulSoup. Bytes are UTF-8, as returned by _fetch_html."""
+        if isinstance(html_content, bytes):
+            return BeautifulSoup(html_content, HTML_PARSER, parse_only=parse_only, from_encoding='utf-8')
+        return BeautifulSoup(html_content, HTML_PARSER, parse_only=parse_only)
+
+    def _tree_from_html(self, html_content: Union[str, bytes], parser: Optional[Any] = None, url: str = "") -> Optional[Any]:
+        """
+        Parse already-fetched markup into an lxml.html element tree. None for empty or unparseable markup.
+        Bytes are UTF-8, as returned by _fetch_html; parser defaults to UTF8_HTML_PARSER.
+        """
+        if lxml_html is None: raise ImportError("lxml is required for _tree_from_html")
+        if not html_content: return None
+        parser = parser or UTF8_HTML_PARSER
+        try: return lxml_html.fromstring(html_content, parser=parser)
+        except ValueError: # str input carrying an XML encoding declaration
+            return lxml_html.fromstring(html_content.encode('utf-8'), parser=parser)
+        except Exception as e:
+            logger.warning(f"Error parsing {url} with lxml: {e}"); return None
+
+    def _cached_parse(self, kind: str, url: str, parse: Callable[[Union[str, bytes]], T], force_refresh: bool = False) -> Optional[T]:
+        """
+        Fetch url and return parse(html), memoized on (scraper, kind, url, page content).
+        Hits come from an in-process LRU, then from pickles under cache_dir/parsed/ (same cache_timeout
+        as the HTML cache), so unchanged pages skip parsing entirely. Cached results are shared: treat as read-only.
+        There is one pickle per (scraper, kind, url), holding the page digest it was parsed from, so a
+        changed page overwrites its old result instead of leaving it behind.
+        Returns None if the page could not be fetched.
+        """
+        html_content = self._fetch_html(url, force_refresh)
+        if html_content is None: return None
+        raw = html_content if isinstance(html_content, bytes) else html_content.encode('utf-8')
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{PARSED_CACHE_VERSION}\0{self.__class__.__name__}\0{kind}\0{url}\0".encode('utf-8')); digest.update(raw)
+        key = digest.hexdigest()
+
+        with self._parsed_lock:
+            if key in self._parsed_cache:
+                self._parsed_cache.move_to_end(key); return self._parsed_cache[key]
+
+        pickle_path = self._parsed_cache_path(kind, url)
+        result: Any = None; loaded = False
+        if pickle_path and self._is_cache_valid(pickle_path):
+            try:
+                with open(pickle_path, 'rb') as f: stored_key, stored_result = pickle.load(f)
+                if stored_key == key:
+                    result = stored_result; loaded = True; logger.debug(f"Parsed-result cache hit for {url} ({kind})")
+            except Exception as e: logger.warning(f"Error reading parsed cache {pickle_path}: {e}")
+        if not loaded:
+            result = parse(html_content)
+            if pickle_path:
+                try:
+                    os.makedirs(os.path.dirname(pickle_path), exist_ok=True); tmp_path = f"{pickle_path}.{os.getpid()}.tmp"
+                    with open(tmp_path, 'wb') as f: pickle.dump((key, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+                    os.replace(tmp_path, pickle_path) # Atomic, so concurrent readers never see a partial pickle
+                except Exception as e: logger.warning(f"Error writing parsed cache {pickle_path}: {e}")
+
+        with self._parsed_lock:
+            self._parsed_cache[key] = result; self._parsed_cache.move_to_end(key)
+            while len(self._parsed_cache) > PARSED_MEMORY_CACHE_SIZE: self._parsed_cache.popitem(last=False)
+        return result
+
+    def _parsed_cache_path(self, kind: str, url: str) -> Optional[str]:
+        """Pickle path for a (scraper, kind, url) parsed result; the '-'-separated class name prefix is what clear_cache matches."""
+        if not self.cache_dir: return None
+        url_hash = hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, 'parsed', f"{self.__class__.__name__}-{kind}-{url_hash}.pkl")
+
+    def _fetch_html(self, url: str, force_refresh: bool = False) -> Optional[Union[str, bytes]]:
+        """
+        Fetch raw page markup (cache, proxies, then direct).
+        Returns the page as UTF-8 bytes, fresh or cached: fresh bodies are re-encoded with to_utf8
+        (header charset first) before caching, so parsers never guess the encoding. None if every attempt failed.
+        """
         cache_path = self._get_cache_path(url)
 
         if cache_path and not force_refresh and self._is_cache_valid(cache_path):
             logger.info(f"{Fore.CYAN}CACHE{Style.RESET_ALL}: Loading {url}")
             try:
-                with open(cache_path, 'r', encoding='utf-8') as f: html_content = f.read()
-                return BeautifulSoup(html_content, 'html.parser')
+                with open(cache_path, 'rb') as f: return f.read()
             except Exception as e:
                 logger.warning(f"Error reading cache file {cache_path}: {e}. Attempting refresh.")
 
@@ -153,13 +376,15 @@ class BaseScraper:
                     continue
 
             try:
-                response = requests.get(
-                    url, headers=self.headers, timeout=20, proxies=proxies_dict # proxies=None if direct
+                response = self._session.get(
+                    url, headers=self.headers, timeout=20, proxies=proxies_dict, # proxies=None if direct
+                    stream=True # Body is read in chunks below, only once the status is known to be OK
                 )
 
                 log_proxy_info = f"{Fore.YELLOW}{urlparse(current_proxy_url).netloc}{Style.RESET_ALL}" if current_proxy_url else "DIRECT"
 
                 if response.status_code >= 400:
+                    response.close()
                     logger.warning(f"{log_prefix}: {Fore.RED}FAIL{Style.RESET_ALL} (HTTP {response.status_code}) "
                                    f"{Style.DIM}Local -> {log_proxy_info}{Style.DIM} -> {target_domain}{Style.RESET_ALL} ({url[:50]}...)")
                     response.raise_for_status() # Trigger retry/failure
@@ -168,13 +393,19 @@ class BaseScraper:
                 logger.info(f"{log_prefix}: {Fore.GREEN}OK{Style.RESET_ALL} (HTTP {response.status_code}) "
                             f"{Style.DIM}Local -> {log_proxy_info}{Style.DIM} -> {target_domain}{Style.RESET_ALL} ({url[:50]}...)")
 
-                html_content = response.text
+                # Kept as bytes (no str copy of the page), normalized to UTF-8 so the HTTP charset
+                # survives caching and cached and fresh pages parse identically
+                try: html_content = b"".join(response.iter_content(chunk_size=65536))
+                finally: response.close()
+                html_content = to_utf8(html_content, response.headers.get('Content-Type'))
                 if cache_path:
                     try:
-                        with open(cache_path, 'w', encoding='utf-8') as f: f.write(html_content)
+                        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                        with open(tmp_path, 'wb') as f: f.write(html_content)
+                        os.replace(tmp_path, cache_path) # Atomic, so concurrent readers never see a partial page
                         logger.debug(f"Saved to cache: {cache_path}")
                     except Exception as e: logger.warning(f"Error writing to cache file {cache_path}: {e}")
-                return BeautifulSoup(html_content, 'html.parser')
+                return html_content
 
             except requests.exceptions.RequestException as e:
                 log_proxy_info = f"{Fore.YELLOW}{urlparse(current_proxy_url).netloc}{Style.RESET_ALL}" if current_proxy_url else "DIRECT"
@@ -188,8 +419,7 @@ class BaseScraper:
                     if cache_path and os.path.exists(cache_path):
                         logger.info(f"{Fore.CYAN}CACHE{Style.RESET_ALL}: Using stale cache as final fallback for {url}")
                         try:
-                            with open(cache_path, 'r', encoding='utf-8') as f: html_content = f.read()
-                            return BeautifulSoup(html_content, 'html.parser')
+                            with open(cache_path, 'rb') as f: return f.read()
                         except Exception as read_e: logger.warning(f"Error reading stale cache file {cache_path}: {read_e}")
                     return None # Failed entirely
                 # Delay only if we are going to retry (with proxy or direct)
@@ -201,25 +431,46 @@ class BaseScraper:
 
         return None
 
+    @classmethod
+    def _sel(cls, selector: str) -> Any:
+        """Compiled soupsieve selector for a CSS string, compiled on first use and reused afterwards."""
+        compiled = cls._compiled_selectors.get(selector)
+        if compiled is None: compiled = cls._compiled_selectors.setdefault(selector, sv.compile(selector))
+        return compiled
+
     def _extract_text(self, soup_or_element: Union[BeautifulSoup, Tag], selector: str, default: str = "") -> str:
         """Extract text from an element"""
         if not soup_or_element:
             return default
-        element = soup_or_element.select_one(selector)
+        element = self._sel(selector).select_one(soup_or_element)
         return element.get_text(strip=True) if element else default
     
+    def _search_text(self, soup_or_element: Union[BeautifulSoup, Tag], pattern: "re.Pattern[str]", window: int = 3) -> Optional["re.Match[str]"]:
+        """
+        Search an element's text lazily, one stripped string at a time, stopping at the first match.
+        Each check spans the last `window` strings joined by spaces (as get_text(" ", strip=True) would),
+        so a 'Password' label, its colon and its value may sit in separate tags.
+        """
+        if not soup_or_element: return None
+        recent: Deque[str] = deque(maxlen=window)
+        for text in soup_or_element.stripped_strings:
+            recent.append(text)
+            match = pattern.search(" ".join(recent))
+            if match: return match
+        return None
+
     def _extract_all_texts(self, soup_or_element: Union[BeautifulSoup, Tag], selector: str) -> List[str]:
         """Extract texts from all matching elements"""
         if not soup_or_element:
             return []
-        elements = soup_or_element.select(selector)
-        return [el.get_text(strip=True) for el in elements if el.get_text(strip=True)]
+        texts = (el.get_text(strip=True) for el in self._sel(selector).iselect(soup_or_element))
+        return [text for text in texts if text]
 
     def _extract_attr(self, soup_or_element: Union[BeautifulSoup, Tag], selector: str, attr: str, default: Optional[str] = None) -> Optional[str]:
         """Extract an attribute from an element"""
         if not soup_or_element:
             return default
-        element = soup_or_element.select_one(selector)
+        element = self._sel(selector).select_one(soup_or_element)
         if element and element.has_attr(attr):
             value = element[attr]
             if isinstance(value, list): 
@@ -245,19 +496,29 @@ class BaseScraper:
         return self._extract_attr(soup_or_element, selector, 'href')
     
     def _format_game_data(self, title: str, url: str, image: Optional[str] = None, 
-                          description: Optional[str] = None, release_date: Optional[str] = None) -> Dict[str, Any]:
+                          description: Optional[str] = None, release_date: Optional[str] = None) -> GameCard:
         """Format game data consistently for all scrapers"""
-        return {
-            "title": title.strip() if title else "Unknown Title",
-            "url": url,
-            "image": image,
-            "description": description.strip() if description else None,
-            "release_date": release_date.strip() if release_date else None,
-            "site": getattr(self.__class__, 'site_id', 'unknown_site') # Use class site_id
-        }
+        return GameCard(
+            title=title.strip() if title else "Unknown Title",
+            url=url,
+            image=image,
+            description=description.strip() if description else None,
+            release_date=release_date.strip() if release_date else None,
+            site=getattr(self.__class__, 'site_id', 'unknown_site') # Use class site_id
+        )
         
     def clear_cache(self) -> None:
-        """Clear the cache for this scraper"""
+        """Clear the cache for this scraper: in-memory parses, its parsed-result pickles and its cached pages"""
+        with self._parsed_lock:
+            self._parsed_cache.clear(); self._soup_cache.clear()
+        parsed_dir = os.path.join(self.cache_dir, 'parsed') if self.cache_dir else None
+        if parsed_dir and os.path.isdir(parsed_dir):
+            parsed_prefix = f"{self.__class__.__name__}-"
+            for filename in os.listdir(parsed_dir):
+                if filename.startswith(parsed_prefix):
+                    try: os.remove(os.path.join(parsed_dir, filename))
+                    except OSError as e: logger.warning(f"Failed to delete parsed cache file {filename}: {e}")
+
         class_site_id = getattr(self.__class__, 'site_id', None)
         if not self.cache_dir or not class_site_id:
             logger.info(f"Cache directory or site_id not set for {self.__class__.__name__}. Cannot clear cache.")
@@ -280,18 +541,19 @@ class BaseScraper:
             return
         logger.info(f"Cache cleared for {class_site_id}: {cleared_count} files removed, {error_count} errors.")
     
-    def get_games_list(self, page: int = 1, category: Optional[str] = None) -> tuple[List[Dict[str, Any]], bool, List[Dict[str, str]]]:
+    def get_games_list(self, page: int = 1, category: Optional[str] = None) -> tuple[List[GameCard], bool, List[Dict[str, str]]]:
         raise NotImplementedError(f"{self.__class__.__name__} must implement get_games_list")
     
-    def get_game_details(self, url: str) -> tuple[Dict[str, Any], Optional[str], Optional[str], List[str], List[Dict[str, Any]], Optional[str], List[Dict[str, Any]]]:
+    def get_game_details(self, url: str) -> tuple[Dict[str, Any], Optional[str], Optional[str], List[str], List[Dict[str, Any]], Optional[str], List[GameCard]]:
         raise NotImplementedError(f"{self.__class__.__name__} must implement get_game_details")
     
-    def search_games(self, query: str) -> List[Dict[str, Any]]:
+    def search_games(self, query: str) -> List[GameCard]:
         raise NotImplementedError(f"{self.__class__.__name__} must implement search_games")
 
-    def _normalize_url(self, url_to_normalize: str, base_url_override: Optional[str] = None) -> Optional[str]:
+    def _normalize_url_impl(self, url_to_normalize: str, base_url_override: Optional[str] = None) -> Optional[str]:
         """
         Normalize a URL by making it absolute.
+        Called through self._normalize_url, the memoized wrapper bound in __init__.
         """
         if not url_to_normalize:
             return None
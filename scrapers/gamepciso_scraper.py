@@ -3,13 +3,44 @@ GamePCISO scraper for the GameStore application.
 """
 import re
 import logging
-from urllib.parse import urljoin, quote, urlparse
-from bs4 import BeautifulSoup, Tag
-from .base_scraper import BaseScraper
-from typing import List, Dict, Any, Optional, Tuple
+from collections import deque
+from itertools import islice
+from urllib.parse import urljoin, quote
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+import soupsieve as sv
+from .base_scraper import BaseScraper, GameCard, AttributeStrainer
+from typing import List, Dict, Any, Optional, Tuple, Deque, Iterator, Set
 
 logger = logging.getLogger(__name__)
 
+# Spoiler titles that can hold download tables, mirrors or passwords; other spoilers (FAQ, tips...) are skipped
+_DL_GROUP_RE = re.compile(r'download|mirror|link|part|update|install|password', re.I)
+# Trailing site boilerplate stripped from titles, applied in order
+_TITLE_SUFFIX_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\s*-\s*Download Game PC Iso New Free$', r'\s*Download\s+Free\s*$', r'\s*Free\s+Download\s*$',
+    r'\s*PC\s+Game\s+Free\s*$', r'\s*PC\s+Game\s*$', r'\s*Full\s+Version\s*$', r'\s*Repack\s*$'))
+# Blogger image size token (/s320/, /s72-c/, /w640-h360-p/...), rewritten to /s1600/ for full size
+_BLOGGER_SIZE_RE = re.compile(r'/(s\d+(-[cp])?|w\d+-h\d+(-[cpkno]+)?)/')
+# Detail-page section headers and password/thumbnail patterns
+_DESC_HEADER_RE = re.compile(r'Info|Description', re.I)
+_SYSREQ_HEADER_RE = re.compile(r'System Requirements', re.I)
+_THUMB_SIZE_RE = re.compile(r'/s\d{2,3}(-c)?/')
+_CELL_PWD_RE = re.compile(r'\((?:Password|Pass)\s*:\s*([\w.-]+)\)')
+_PWD_LABEL_RE = re.compile(r"(?:Password|Pass)[^:]*:\s*([\w.-]+)", re.I)
+_PWD_PAREN_RE = re.compile(r"\((?:Password|Pass):\s*([\w.-]+)\)", re.I)
+# Category slug: the path segment right after a leading /category/ (same as urlparse().path.strip('/').split('/')[1])
+_CATEGORY_SLUG_RE = re.compile(r'^(?:[^:/?#]+:)?(?://[^/?#]*)?/*category/([^/?#;]+)')
+_RELATED_LINK_SEL = sv.compile("a[href]")
+# Listing/search pages only need the post cards, the paginator and the category menu
+_LISTING_STRAINER = SoupStrainer(class_=re.compile(r'(^|\s)(post|phantrang|menu-menu-ben-trai-container)(\s|$)'))
+# Detail pages are only read inside the post body and the related-posts block; skip the Blogger chrome
+_POST_BODY_CLASS_RE = re.compile(r'(^|\s)post-body(\s|$)')
+def _is_detail_root(name: str, attrs: Dict[str, Any]) -> bool:
+    classes = attrs.get('class') or ''
+    if not isinstance(classes, str): classes = ' '.join(classes)
+    return attrs.get('id') == 'related-posts' or (name == 'div' and bool(_POST_BODY_CLASS_RE.search(classes)))
+_DETAIL_STRAINER = AttributeStrainer(_is_detail_root)
+
 class GamePCISOScraper(BaseScraper):
     site_id: str = "gamepciso"
     site_name: str = "GamePCISO"
@@ -25,56 +56,59 @@ class GamePCISOScraper(BaseScraper):
     # ... (_clean_title, _resolve_image_url, get_games_list methods remain unchanged) ...
     def _clean_title(self, title: str) -> str:
         if not title: return "Unknown Title"
-        title = re.sub(r'\s*-\s*Download Game PC Iso New Free$', '', title, flags=re.IGNORECASE)
-        title = re.sub(r'\s*Download\s+Free\s*$', '', title, flags=re.IGNORECASE)
-        title = re.sub(r'\s*Free\s+Download\s*$', '', title, flags=re.IGNORECASE)
-        title = re.sub(r'\s*PC\s+Game\s+Free\s*$', '', title, flags=re.IGNORECASE)
-        title = re.sub(r'\s*PC\s+Game\s*$', '', title, flags=re.IGNORECASE)
-        title = re.sub(r'\s*Full\s+Version\s*$', '', title, flags=re.IGNORECASE)
-        title = re.sub(r'\s*Repack\s*$', '', title, flags=re.IGNORECASE)
+        for suffix_re in _TITLE_SUFFIX_RES: title = suffix_re.sub('', title)
         return title.strip()
     def _resolve_image_url(self, img_url: Optional[str], base_page_url: Optional[str] = None) -> Optional[str]:
         if not img_url: return None
         full_url = self._normalize_url(img_url, base_page_url or self.base_url)
         if not full_url: return None
-        match = re.search(r'/(s\d+(-[cp])?|w\d+-h\d+(-[cpkno]+)?)/', full_url)
+        if full_url.startswith('data:') or '/s1600/' in full_url: return full_url # Inline or already full size
+        if '/s' not in full_url and '/w' not in full_url: return full_url # No Blogger size token possible
+        match = _BLOGGER_SIZE_RE.search(full_url)
         if match: return full_url.replace(match.group(1), "s1600")
-        if full_url.startswith('data:'): return full_url
         return full_url
-    def get_games_list(self, page: int = 1, category: Optional[str] = None) -> Tuple[List[Dict[str, Any]], bool, List[Dict[str, str]]]:
-        if not self.base_url: logger.error(f"{self.site_name}: base_url is not set."); return [], False, []
-        if category: safe_category = quote(category); url = f"{self.base_url}/category/{safe_category}/page/{page}/" if page > 1 else f"{self.base_url}/category/{safe_category}/"
-        else: url = f"{self.base_url}/page/{page}/" if page > 1 else self.base_url + "/"
-        logger.info(f"Fetching game list from: {url}"); soup: Optional[BeautifulSoup] = self._get_soup(url)
-        if not soup: return [], False, []
-        games: List[Dict[str, Any]] = []
+    def _iter_game_cards(self, soup: BeautifulSoup) -> Iterator[GameCard]:
+        """Yield one formatted game entry per post card on a listing or search page, lazily."""
         for game_el in soup.select("div.post.bar.hentry"):
             link_el = game_el.select_one("h2.post-title.entry-title a");
             if not link_el or not link_el.get('href'): continue
             game_url = self._normalize_url(link_el['href']);
             if not game_url: continue
-            cleaned_title = self._clean_title(link_el.get_text(strip=True))
+            raw_title = link_el.get_text(strip=True); cleaned_title = self._clean_title(raw_title)
             img_el = game_el.select_one(".post-body div[id^='summary'] img, .post-body img"); image_url: Optional[str] = None
             if img_el: src_candidate = img_el.get('data-src') or img_el.get('src') or img_el.get('data-lazy-src'); image_url = self._resolve_image_url(src_candidate, game_url) if src_candidate else None
             release_date = None; date_el = game_el.select_one(".postmeta .date, .entry-date, time.published")
             if date_el: release_date = date_el.get_text(strip=True) or date_el.get('datetime')
-            games.append(self._format_game_data(title=cleaned_title, url=game_url, image=image_url, release_date=release_date))
+            yield self._format_game_data(title=cleaned_title, url=game_url, image=image_url, release_date=release_date)
+    def get_games_list(self, page: int = 1, category: Optional[str] = None) -> Tuple[List[GameCard], bool, List[Dict[str, str]]]:
+        if not self.base_url: logger.error(f"{self.site_name}: base_url is not set."); return [], False, []
+        if category: safe_category = quote(category); url = f"{self.base_url}/category/{safe_category}/page/{page}/" if page > 1 else f"{self.base_url}/category/{safe_category}/"
+        else: url = f"{self.base_url}/page/{page}/" if page > 1 else self.base_url + "/"
+        logger.info(f"Fetching game list from: {url}"); soup: Optional[BeautifulSoup] = self._get_soup(url, parse_only=_LISTING_STRAINER)
+        if not soup: return [], False, []
+        games: List[GameCard] = list(self._iter_game_cards(soup))
         next_link_el = soup.select_one(".phantrang .wp-pagenavi a.nextpostslink, .phantrang .wp-pagenavi a[rel='next']"); has_next = bool(next_link_el and next_link_el.get('href'))
         if not games and page > 1: has_next = False; logger.info(f"Games found: {len(games)}, Has next page: {has_next}")
-        categories: List[Dict[str, str]] = []; category_links = soup.select("#Label7 .menu-menu-ben-trai-container li a")
-        for cat_link in category_links:
-            cat_name = cat_link.get_text(strip=True); cat_href = self._normalize_url(cat_link.get('href'))
-            if cat_name and cat_href: path_parts = urlparse(cat_href).path.strip('/').split('/'); slug = path_parts[1] if len(path_parts) > 1 and path_parts[0] == 'category' else None; categories.append({"name": cat_name, "slug": slug}) if slug else None
-        if categories: unique_categories_dict = {item['slug'].lower(): item for item in categories}; categories = sorted(list(unique_categories_dict.values()), key=lambda x: x['name'])
+        categories_by_slug: Dict[str, Dict[str, str]] = {} # Lower-cased slug -> last entry seen, kept in first-seen order
+        for cat_link in soup.select(".menu-menu-ben-trai-container li a"):
+            cat_name = cat_link.get_text(strip=True)
+            if not cat_name: continue
+            cat_href = self._normalize_url(cat_link.get('href'))
+            slug_match = _CATEGORY_SLUG_RE.match(cat_href) if cat_href else None
+            if slug_match: slug = slug_match.group(1); categories_by_slug[slug.lower()] = {"name": cat_name, "slug": slug}
+        categories: List[Dict[str, str]] = list(categories_by_slug.values()); categories.sort(key=lambda x: x['name'])
         logger.info(f"Processed {len(categories)} unique categories."); return games, has_next, categories
 
 
-    def get_game_details(self, url: str) -> Tuple[Dict[str, Any], Optional[str], Optional[str], List[str], List[Dict[str, Any]], Optional[str], List[Dict[str, Any]]]:
+    def get_game_details(self, url: str) -> Tuple[Dict[str, Any], Optional[str], Optional[str], List[str], List[Dict[str, Any]], Optional[str], List[GameCard]]:
         logger.info(f"Getting game details for: {url}")
-        soup: Optional[BeautifulSoup] = self._get_soup(url)
+        soup: Optional[BeautifulSoup] = self._get_soup(url, parse_only=_DETAIL_STRAINER)
         if not soup: return {}, None, None, [], [], None, []
 
-        content_area = soup.select_one("div.post-body.entry-content") or soup.body
+        content_area = soup.select_one("div.post-body.entry-content")
+        if not content_area: # Unfamiliar layout: parse the whole page and fall back to <body>
+            soup = self._get_soup(url)
+            content_area = soup.body if soup else None
         if not content_area: return {}, None, None, [], [], None, []
 
         meta: Dict[str, Any] = {"url": url, "site": self.site_id}
@@ -90,15 +124,15 @@ class GamePCISOScraper(BaseScraper):
             cover_td = info_table.select_one("tr > td[rowspan], tr > td:first-child");
             if cover_td: img_tag = cover_td.find("img"); cover_img_url = self._resolve_image_url(img_tag.get('src'), url) if img_tag and img_tag.get('src') else None
         meta["image"] = cover_img_url; logger.debug(f"Info Table Meta: Genre={meta['genre']}, Date={meta['release_date']}, Image={'Yes' if meta['image'] else 'No'}")
-        description_parts: List[str] = []; desc_header = content_area.find(['h2', 'h3'], string=re.compile(r'Info|Description', re.I)); start_node = desc_header if desc_header else info_table; current_node = start_node.next_sibling if start_node else None; stop_found = False
+        description_parts: Deque[str] = deque(); desc_header = content_area.find(['h2', 'h3'], string=_DESC_HEADER_RE); start_node = desc_header if desc_header else info_table; current_node = start_node.next_sibling if start_node else None; stop_found = False
         while current_node and not stop_found:
              if isinstance(current_node, Tag):
-                 if current_node.name in ['h2','h3'] and not re.search(r'Info|Description', current_node.get_text(strip=True), re.I): stop_found = True; break
+                 if current_node.name in ['h2','h3'] and not _DESC_HEADER_RE.search(current_node.get_text(strip=True)): stop_found = True; break
                  if current_node.name == 'div' and ('su-spoiler' in current_node.get('class', []) or 'separator' in current_node.get('class', [])): stop_found = True; break
                  if current_node.name == 'p': text = current_node.get_text(strip=True); description_parts.append(text) if text else None
              current_node = current_node.next_sibling
         description: Optional[str] = "\n\n".join(description_parts).strip() if description_parts else None; logger.debug(f"Extracted Description: {'Yes' if description else 'No'}, Length: {len(description or '')}")
-        sysreq_parts: List[str] = []; sysreq_header = content_area.find(['h2','h3'], string=re.compile(r'System Requirements', re.I))
+        sysreq_parts: Deque[str] = deque(); sysreq_header = content_area.find(['h2','h3'], string=_SYSREQ_HEADER_RE)
         if sysreq_header:
              current_node = sysreq_header.next_sibling; stop_found = False
              while current_node and not stop_found:
@@ -109,18 +143,20 @@ class GamePCISOScraper(BaseScraper):
                  elif not isinstance(current_node, Tag) and current_node.strip(): sysreq_parts.append(current_node.strip())
                  current_node = current_node.next_sibling
         sysreq: Optional[str] = "\n".join(sysreq_parts).strip() if sysreq_parts else None; logger.debug(f"Extracted System Req: {'Yes' if sysreq else 'No'}, Length: {len(sysreq or '')}")
-        screenshots: List[str] = []; screenshot_tags = content_area.select("div.separator > a > img"); logger.debug(f"Found {len(screenshot_tags)} potential screenshot images in separators.")
+        screenshots: List[str] = []; seen_screenshots: Set[str] = set(); screenshot_tags = content_area.select("div.separator > a > img"); logger.debug(f"Found {len(screenshot_tags)} potential screenshot images in separators.")
         for img_el in screenshot_tags:
             parent_separator = img_el.find_parent('div', class_='separator'); preceding_spoiler = parent_separator.find_previous_sibling('div', class_='su-spoiler') if parent_separator else None
             if parent_separator and preceding_spoiler:
                 src = img_el.get('src') or img_el.get('data-lazy-src')
-                if src: full_src = self._resolve_image_url(src, url)
-                if full_src and full_src != meta.get("image") and 'ytimg' not in full_src and not re.search(r'/s\d{2,3}(-c)?/', full_src): screenshots.append(full_src) if full_src not in screenshots else None
+                full_src = self._resolve_image_url(src, url) if src else None
+                if full_src and full_src not in seen_screenshots and full_src != meta.get("image") and 'ytimg' not in full_src and not _THUMB_SIZE_RE.search(full_src):
+                    seen_screenshots.add(full_src); screenshots.append(full_src)
             else: logger.debug("Skipping image in separator, might not be screenshot.")
         logger.info(f"Found {len(screenshots)} screenshots.")
 
         # ===== Downloads & Password =====
         downloads: List[Dict[str, Any]] = []
+        seen_downloads: Set[str] = set() # Download URLs already collected, across all groups
         passwords_found: Dict[str, str] = {}
         main_password: Optional[str] = None # <<< Initialize main_password
         password: Optional[str] = None # <<< Initialize final password
@@ -130,7 +166,11 @@ class GamePCISOScraper(BaseScraper):
 
         for spoiler_el in spoiler_elements:
             spoiler_title_el = spoiler_el.select_one(".su-spoiler-title")
-            group_title = self._clean_title(spoiler_title_el.get_text(strip=True)) if spoiler_title_el else "Download Links"
+            raw_group_title = spoiler_title_el.get_text(strip=True) if spoiler_title_el else ""
+            if raw_group_title and not _DL_GROUP_RE.search(raw_group_title):
+                logger.debug(f"Skipping non-download spoiler: {raw_group_title}")
+                continue
+            group_title = self._clean_title(raw_group_title) if spoiler_title_el else "Download Links"
             group_password = None
 
             spoiler_content_el = spoiler_el.select_one(".su-spoiler-content")
@@ -139,38 +179,44 @@ class GamePCISOScraper(BaseScraper):
             table = spoiler_content_el.find("table")
             if table:
                 headers = [th.get_text(strip=True).replace('Link', '').strip() for th in table.select("tr:first-child th")]
+                n_headers = len(headers); headers_tail = headers[1:] # Host names, aligned with the cells after the part column
                 data_rows = table.select("tr:not(:first-child)")
 
+                cells: List[Tag] = []
                 for row_idx, row in enumerate(data_rows):
-                    cells = row.find_all("td");
+                    prev_cells, cells = cells, row.find_all("td") # Previous row's cells are kept for the alt-row layout
                     if not cells: continue
-                    part_name_tag = cells[0].find('center'); part_name = part_name_tag.get_text(strip=True) if part_name_tag else cells[0].get_text(strip=True)
+                    first_cell, *rest_cells = cells
+                    part_name_tag = first_cell.find('center'); part_name = part_name_tag.get_text(strip=True) if part_name_tag else first_cell.get_text(strip=True)
 
                     if "password" in part_name.lower() and len(cells) > 1:
-                        pwd_tag = cells[1].find('center'); pwd_text = pwd_tag.get_text(strip=True) if pwd_tag else cells[1].get_text(strip=True)
+                        pwd_tag = rest_cells[0].find('center'); pwd_text = pwd_tag.get_text(strip=True) if pwd_tag else rest_cells[0].get_text(strip=True)
                         if pwd_text:
                             if "extract" in part_name.lower():
                                 if not main_password: main_password = pwd_text # Prioritize first main password
                             elif not group_password: group_password = pwd_text
                             logger.debug(f"Password found in table row: {pwd_text} (Group: {group_title}, Main Candidate: {main_password is not None})")
                     elif len(cells) > 1:
-                        cell_pass_match = re.search(r'\((?:Password|Pass)\s*:\s*([\w.-]+)\)', row.get_text())
+                        cell_pass_match = _CELL_PWD_RE.search(row.get_text())
                         if cell_pass_match and not group_password and not main_password: group_password = cell_pass_match.group(1); logger.debug(f"Cell Password found: {group_password} for Group: {group_title}")
-                        if len(headers) == len(cells):
-                             for i, cell in enumerate(cells[1:], start=1):
-                                 link_el = cell.find("a");
-                                 if link_el and link_el.get('href'):
-                                     href = self._normalize_url(link_el['href']); host_name = headers[i] if i < len(headers) else f"Link {i}"
+                        # One anchor walk per row; first linked anchor of each cell, keyed by the cell's identity
+                        anchors_by_cell: Dict[int, Tag] = {}
+                        for anchor in row.find_all("a", href=True): anchors_by_cell.setdefault(id(anchor.find_parent("td")), anchor)
+                        if n_headers == len(cells):
+                             for host_name, cell in zip(headers_tail, rest_cells):
+                                 link_el = anchors_by_cell.get(id(cell))
+                                 if link_el:
+                                     href = self._normalize_url(link_el['href'])
                                      text = f"{host_name} - {part_name}"
-                                     if href and not any(d['url'] == href for d in downloads): downloads.append({"url": href, "text": text, "group": group_title, "section": host_name, "type": "table"})
-                        elif len(headers) < len(cells) and row_idx > 0:
-                             host_names_row2 = [c.get_text(strip=True) for c in data_rows[row_idx-1].find_all('td')[1:]]
-                             part_name_prev = data_rows[row_idx-1].find('td').get_text(strip=True)
+                                     if href and href not in seen_downloads: seen_downloads.add(href); downloads.append({"url": href, "text": text, "group": group_title, "section": host_name, "type": "table"})
+                        elif n_headers < len(cells) and row_idx > 0 and prev_cells:
+                             host_names_row2 = [c.get_text(strip=True) for c in prev_cells[1:]]
+                             part_name_prev = prev_cells[0].get_text(strip=True)
                              for i, cell in enumerate(cells):
-                                 link_el = cell.find("a"); host_name = host_names_row2[i] if i < len(host_names_row2) else f"Alt Link {i+1}"
-                                 if link_el and link_el.get('href'):
+                                 link_el = anchors_by_cell.get(id(cell)); host_name = host_names_row2[i] if i < len(host_names_row2) else f"Alt Link {i+1}"
+                                 if link_el:
                                      href = self._normalize_url(link_el['href']); text = f"{host_name} - {part_name_prev}"
-                                     if href and not any(d['url'] == href for d in downloads): downloads.append({"url": href, "text": text, "group": group_title, "section": "Table Links (Alt Row)"})
+                                     if href and href not in seen_downloads: seen_downloads.add(href); downloads.append({"url": href, "text": text, "group": group_title, "section": "Table Links (Alt Row)"})
 
             # Paragraph Links (Mirrors) - Process regardless of table
             paragraph_links = spoiler_content_el.select("p a[href]")
@@ -188,14 +234,12 @@ class GamePCISOScraper(BaseScraper):
                          if prefix and len(prefix) < 20: text = f"{prefix} - {text}"
                      if href_raw and not href_raw.strip().startswith(('javascript:', '#')):
                          href = self._normalize_url(href_raw)
-                         if href and not any(d['url'] == href for d in downloads): downloads.append({"url": href, "text": text, "group": group_title, "section": current_para_section, "type": "paragraph"})
+                         if href and href not in seen_downloads: seen_downloads.add(href); downloads.append({"url": href, "text": text, "group": group_title, "section": current_para_section, "type": "paragraph"})
 
             # Password extraction fallback inside spoiler (if not in table)
             if not main_password and not group_password: # Only search if no password found yet for this group
-                content_text = spoiler_content_el.get_text(" ", strip=True)
-                pwd_match_1 = re.search(r"(?:Password|Pass)[^:]*:\s*([\w.-]+)", content_text, re.I); pwd_match_2 = re.search(r"\((?:Password|Pass):\s*([\w.-]+)\)", content_text, re.I)
-                if pwd_match_1: group_password = pwd_match_1.group(1)
-                elif pwd_match_2: group_password = pwd_match_2.group(1)
+                pwd_match = self._search_text(spoiler_content_el, _PWD_LABEL_RE) or self._search_text(spoiler_content_el, _PWD_PAREN_RE)
+                if pwd_match: group_password = pwd_match.group(1)
                 if group_password: logger.debug(f"Password found via regex in spoiler '{group_title}': {group_password}")
             if group_password: passwords_found[group_title] = group_password
 
@@ -213,11 +257,9 @@ class GamePCISOScraper(BaseScraper):
 
         # Final fallback if still no password
         if not password:
-            body_text = content_area.get_text(" ", strip=True)
-            pwd_match_1 = re.search(r"(?:Password|Pass)[^:]*:\s*([\w.-]+)", body_text, re.IGNORECASE)
-            pwd_match_2 = re.search(r"\((?:Password|Pass):\s*([\w.-]+)\)", body_text, re.IGNORECASE)
-            if pwd_match_1: password = pwd_match_1.group(1)
-            elif pwd_match_2: password = pwd_match_2.group(1)
+            # Streams the body's strings and stops at the first hit instead of joining the whole page's text
+            pwd_match = self._search_text(content_area, _PWD_LABEL_RE) or self._search_text(content_area, _PWD_PAREN_RE)
+            if pwd_match: password = pwd_match.group(1)
             if password: logger.debug(f"Password found via regex in body: {password}")
 
         logger.info(f"Found {len(downloads)} download links. Final Password: {password}")
@@ -227,25 +269,12 @@ class GamePCISOScraper(BaseScraper):
         meta['video_embed_url'] = self._normalize_url(youtube_iframe['src']) if youtube_iframe and youtube_iframe.get('src') else None
         logger.debug(f"YouTube video: {meta['video_embed_url'] or 'Not Found'}")
 
-        # --- Screenshots ---
-        # ... (Screenshots extraction logic remains the same) ...
-        screenshots: List[str] = []; screenshot_tags = content_area.select("div.separator > a > img"); logger.debug(f"Found {len(screenshot_tags)} potential screenshot images in separators.")
-        for img_el in screenshot_tags:
-            parent_separator = img_el.find_parent('div', class_='separator'); preceding_spoiler = parent_separator.find_previous_sibling('div', class_='su-spoiler') if parent_separator else None
-            if parent_separator and preceding_spoiler:
-                src = img_el.get('src') or img_el.get('data-lazy-src')
-                if src: full_src = self._resolve_image_url(src, url)
-                if full_src and full_src != meta.get("image") and 'ytimg' not in full_src and not re.search(r'/s\d{2,3}(-c)?/', full_src): screenshots.append(full_src) if full_src not in screenshots else None
-            else: logger.debug("Skipping image in separator, might not be screenshot.")
-        logger.info(f"Found {len(screenshots)} screenshots.")
-
-
         # --- Related Games ---
         # ... (Related games extraction logic remains the same) ...
-        related_games: List[Dict[str, Any]] = []; related_container = soup.select_one("div#related-posts")
+        related_games: List[GameCard] = []; related_container = soup.select_one("div#related-posts"); seen_related: Set[str] = set(); meta_title_cf = meta["title"].casefold()
         if related_container:
             logger.debug("Related posts container found.")
-            for link_el in related_container.select("a[href]"):
+            for link_el in _RELATED_LINK_SEL.iselect(related_container): # Lazy: anchors past the cap are never matched
                  related_url_raw = link_el.get('href')
                  if not related_url_raw or related_url_raw == url: continue
                  related_url = self._normalize_url(related_url_raw)
@@ -255,30 +284,21 @@ class GamePCISOScraper(BaseScraper):
                  if title_div: related_title_text = title_div.get_text(strip=True)
                  if img_tag: related_image = self._resolve_image_url(img_tag.get('src'), related_url); related_title_text = img_tag.get('alt', '') if not related_title_text else related_title_text
                  related_title = self._clean_title(related_title_text or related_url.split('/')[-1].replace('-', ' ').title())
-                 if related_title and related_title.lower() != meta["title"].lower():
-                     if not any(g['url'] == related_url for g in related_games): related_games.append(self._format_game_data(title=related_title, url=related_url, image=related_image))
+                 if related_title and related_title.casefold() != meta_title_cf:
+                     if related_url not in seen_related: seen_related.add(related_url); related_games.append(self._format_game_data(title=related_title, url=related_url, image=related_image))
                  if len(related_games) >= 8: break
         logger.info(f"Found {len(related_games)} related games.")
 
         return meta, description, sysreq, screenshots, downloads, password, related_games
 
-    def search_games(self, query: str) -> List[Dict[str, Any]]:
+    def search_games(self, query: str) -> List[GameCard]:
         # ... (unchanged from previous version) ...
         if not self.base_url: return []
         search_url = f"{self.base_url}/?s={quote(query)}"; logger.info(f"Searching GamePCISO with URL: {search_url}")
-        soup: Optional[BeautifulSoup] = self._get_soup(search_url);
+        soup: Optional[BeautifulSoup] = self._get_soup(search_url, parse_only=_LISTING_STRAINER);
         if not soup: return []
-        games: List[Dict[str, Any]] = []
-        for game_el in soup.select("div.post.bar.hentry"):
-            link_el = game_el.select_one("h2.post-title.entry-title a");
-            if not link_el or not link_el.get('href'): continue
-            game_url = self._normalize_url(link_el['href']);
-            if not game_url: continue
-            cleaned_title = self._clean_title(link_el.get_text(strip=True))
-            img_el = game_el.select_one(".post-body div[id^='summary'] img, .post-body img"); image_url: Optional[str] = None
-            if img_el: src_candidate = img_el.get('src') or img_el.get('data-lazy-src'); image_url = self._resolve_image_url(src_candidate, game_url) if src_candidate else None
-            release_date = None; date_el = game_el.select_one(".postmeta .date, .entry-date, time.published")
-            if date_el: release_date = date_el.get_text(strip=True) or date_el.get('datetime')
-            games.append(self._format_game_data(title=cleaned_title, url=game_url, image=image_url, release_date=release_date))
-            if len(games) >= 20: break
-        logger.info(f"Found {len(games)} results for search query: '{query}'"); return games
\ No newline at end of file
+        games: List[GameCard] = list(islice(self._iter_game_cards(soup), 20))
+        logger.info(f"Found {len(games)} results for search query: '{query}'"); return games
+
+# Picked up by ScraperFactory discovery without scanning the module
+SCRAPER_CLASS = GamePCISOScraper
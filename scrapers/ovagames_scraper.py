@@ -2,13 +2,103 @@
 
 import re
 import logging
-from urllib.parse import urljoin, quote, urlparse
+from itertools import islice
+from urllib.parse import urljoin, quote
 from bs4 import BeautifulSoup, Tag
-from .base_scraper import BaseScraper
-from typing import List, Dict, Any, Optional, Tuple
+from lxml import etree, html as lxml_html
+import soupsieve as sv
+from .base_scraper import BaseScraper, GameCard, AttributeStrainer, xpath_has_class
+from typing import List, Dict, Any, Optional, Tuple, Iterator, Set, Union
 
 logger = logging.getLogger(__name__)
 
+# Listing pages only need element structure; dropping comments and PIs at parse time keeps the tree lean.
+# The encoding matches the UTF-8 bytes _fetch_html returns
+_LISTING_PARSER = lxml_html.HTMLParser(encoding='utf-8', remove_comments=True, remove_pis=True)
+
+# Listing/search selectors, compiled once (libxml2 evaluates them in C)
+_GAMES_XPATH = etree.XPath(f"//div[{xpath_has_class('home-post-wrap')}]")
+_LINK_XPATH = etree.XPath(f"(.//*[{xpath_has_class('home-post-titles')}]//h2//a)[1]")
+_IMG_XPATH = etree.XPath(f"(.//*[{xpath_has_class('post-inside')}]//a//img[{xpath_has_class('thumbnail')}])[1]")
+_NEXT_XPATH = etree.XPath(f"//div[{xpath_has_class('wp-pagenavi')}]//a[{xpath_has_class('nextpostslink')}]/@href")
+# The two sidebar sources share their prefix, so the sidebar is located once and both widgets are matched under it
+_CATEGORIES_XPATH = etree.XPath(
+    f"//ul[@id='menu-2nd']//li[{xpath_has_class('menu-item-object-category')}]//a"
+    f" | //*[{xpath_has_class('sidebar')}]//*[{xpath_has_class('widget_categories')} or @id='categories-3']//ul//li//a")
+
+# Detail-page patterns, compiled once instead of on every get_game_details call
+_INFO_LABEL_RE = re.compile(r'(Title|Genre|Developer|Publisher|Release Date|Mirrors|File Size)\s*:', re.I)
+# One scan of the info blob yields every label:value pair; the lookahead leaves the next label unconsumed
+_BLOB_FIELD_RE = re.compile(r"(Genre|Developer|Publisher|Release Date|File Size|Mirrors)\s*:\s*(.*?)(?=\n|\r|Release Date:|Genre:|Developer:|Publisher:|Mirrors:|File Size:|$)", re.I | re.S)
+_BLOB_META_KEYS = {"genre": "genre", "developer": "developer", "publisher": "publisher", "release date": "release_date", "file size": "file_size", "mirrors": "mirrors_text"}
+_RAR_PWD_RE = re.compile(r"(?:Rar |Filecrypt folder )?password\s*:?\s*([\w\.-]+)", re.I)
+_PWD_RE = re.compile(r"Password\s*:?\s*([\w.-]+)", re.I)
+_INTRO_PARA_RE = re.compile(r'free download.*repack pc game', re.I)
+_REL_SLUG_RE = re.compile(r'/[a-zA-Z0-9-]+/?$')
+_SECTION_HEADER_TAGS = frozenset(('h2', 'h3', 'strong', 'b'))
+# Fallback section headers are classified by keyword; 'minimum' + 'recommended' together also mark system requirements
+_HEADER_KEYWORD_RE = re.compile(r'description|system requirements|minimum|recommended|screenshot|link download|download link|install note', re.I)
+_HEADER_KEYWORD_SECTION = {'description': 'desc', 'system requirements': 'sysreq', 'screenshot': 'screen', 'link download': 'dl', 'download link': 'dl', 'install note': 'install'}
+_SECTION_ORDER = ('desc', 'sysreq', 'screen', 'dl', 'install')
+# Slug of a category link: last path segment under /category/..., or a single top-level segment
+_CATEGORY_SLUG_RE = re.compile(r'^(?:https?:)?(?://[^/?#]*)?/(?:category/(?:[^/?#]*/)*)?([^/?#]+)/?(?:[?#]|$)')
+# Detail pages are only read inside the content area, the tab container and the related-posts widget;
+# straining to those roots skips building nodes for headers, sidebars, footers and comments
+_DETAIL_ROOT_CLASS_RE = re.compile(r'(^|\s)(post-wrapper|post-content|entry-content|single-post|wp-tabs|tabs-container|related-posts|rp4wp-related-posts)(\s|$)')
+def _is_detail_root(name: str, attrs: Dict[str, Any]) -> bool:
+    classes = attrs.get('class') or ''; tag_id = attrs.get('id') or ''
+    if not isinstance(classes, str): classes = ' '.join(classes)
+    return bool(_DETAIL_ROOT_CLASS_RE.search(classes)) or tag_id in ('tabs', 'yarpp_widget-') or 'related' in tag_id
+_DETAIL_STRAINER = AttributeStrainer(_is_detail_root)
+_TAB_DL_ITEM_SEL = sv.compile(".dl-wraps-item")
+_TAB_DL_LINK_SEL = sv.compile("p a[href]")
+_RELATED_LINK_SEL = sv.compile("a[href]")
+# Type-led single selectors (same matches as the unions "img.aligncenter, a[href*='.jpg'] > img, ..." and
+# "p > a[href], li > a[href]"): each candidate is rejected on its tag name once instead of once per branch.
+_FALLBACK_SHOT_SEL = sv.compile("img:is(.aligncenter, a:is([href*='.jpg'], [href*='.png']) > *)")
+_FALLBACK_DL_SEL = sv.compile("a[href]:is(p > *, li > *)")
+
+def _clean_blob_value(raw: str) -> Optional[str]:
+    """Tidy a captured info-blob value, dropping stray <br> markup and trailing 'Label:' spill-over."""
+    value = raw.strip()
+    if not value: return None
+    value = value.replace('<br>', '').replace('<br/>', '')
+    if value and ':' in value and not any(l+':' in value for l in ['http', 'https']): value = value.split(':')[0].strip()
+    return value
+
+def _section_nodes(start_node: Tag, end_node: Optional[Tag], index_maps: Optional[Dict[int, Dict[int, int]]] = None) -> List[Any]:
+    """
+    Siblings after start_node up to (not including) end_node, or to the end of the parent if end_node is not a later sibling.
+    index_maps (parent id -> child id -> position) is filled on first use, so sections sharing a parent
+    enumerate its children once instead of a linear index() scan per boundary.
+    """
+    parent = start_node.parent
+    if parent is None: return []
+    siblings = parent.contents
+    positions = index_maps.get(id(parent)) if index_maps is not None else None
+    if positions is None:
+        positions = {id(node): i for i, node in enumerate(siblings)}
+        if index_maps is not None: index_maps[id(parent)] = positions
+    start_idx = positions[id(start_node)] + 1
+    end_idx = len(siblings)
+    if end_node is not None and end_node.parent is parent:
+        idx = positions[id(end_node)]
+        if idx >= start_idx: end_idx = idx
+    return siblings[start_idx:end_idx]
+
+def _select_in_nodes(nodes: List[Tag], selector: Any) -> Iterator[Tag]:
+    """Tags matched by a compiled soupsieve selector among nodes (themselves included) and their descendants."""
+    for node in nodes:
+        if selector.match(node): yield node
+        yield from selector.select(node)
+
+def _iter_info_sources(content_area: Tag) -> Iterator[Tag]:
+    """First 10 direct <p>/<div> children of the content area, or its first 15 nested ones if it has none, lazily."""
+    has_direct = False
+    for child in islice((c for c in content_area.children if isinstance(c, Tag) and c.name in ('p', 'div')), 10):
+        has_direct = True; yield child
+    if not has_direct: yield from content_area.find_all(['p', 'div'], limit=15)
+
 class OvaGamesScraper(BaseScraper):
     site_id: str = "ovagames"
     site_name: str = "OvaGames"
@@ -21,69 +111,76 @@ class OvaGamesScraper(BaseScraper):
         effective_base_url = base_url_override or self.base_url
         super().__init__(effective_base_url, cache_dir, cache_timeout)
 
-    # --- get_games_list remains unchanged ---
-    def get_games_list(self, page: int = 1, category: Optional[str] = None) -> Tuple[List[Dict[str, Any]], bool, List[Dict[str, str]]]:
+    def _iter_game_cards(self, tree: Any) -> Iterator[GameCard]:
+        """Yield one formatted game entry per post card on a listing or search page (lxml tree), lazily."""
+        for game_entry_el in _GAMES_XPATH(tree):
+            link_els = _LINK_XPATH(game_entry_el)
+            if not link_els or not link_els[0].get('href'): continue
+            link_el = link_els[0]; game_url = self._normalize_url(link_el.get('href'))
+            if not game_url: continue
+            title = link_el.text_content().strip() or "Unknown Title"
+            img_els = _IMG_XPATH(game_entry_el)
+            image_url: Optional[str] = None
+            if img_els: src_candidate = img_els[0].get('src') or img_els[0].get('data-src'); image_url = self._normalize_url(src_candidate) if src_candidate else None
+            yield self._format_game_data(title=title, url=game_url, image=image_url)
+
+    def get_games_list(self, page: int = 1, category: Optional[str] = None) -> Tuple[List[GameCard], bool, List[Dict[str, str]]]:
         if not self.base_url: logger.error("OvaGamesScraper: base_url is not set."); return [], False, []
         if category: url = f"{self.base_url}/category/{quote(category)}/page/{page}"
         else: url = f"{self.base_url}/page/{page}"
-        soup: Optional[BeautifulSoup] = self._get_soup(url)
-        if not soup: logger.warning(f"Failed to get soup object for URL: {url}"); return [], False, []
-        games: List[Dict[str, Any]] = []
-        for game_entry_el in soup.select("div.home-post-wrap"):
-            link_el = game_entry_el.select_one(".home-post-titles h2 a")
-            if not link_el or not link_el.get('href'): continue
-            game_url = self._normalize_url(link_el['href'])
-            if not game_url: continue
-            title = link_el.get_text(strip=True) or "Unknown Title"
-            img_el = game_entry_el.select_one(".post-inside a img.thumbnail")
-            image_url: Optional[str] = None
-            if img_el: src_candidate = img_el.get('src') or img_el.get('data-src'); image_url = self._normalize_url(src_candidate) if src_candidate else None
-            games.append(self._format_game_data(title=title, url=game_url, image=image_url, release_date=None))
-        next_link_el = soup.select_one("div.wp-pagenavi a.nextpostslink"); has_next = bool(next_link_el and next_link_el.get('href'))
+        parsed = self._cached_parse("games_list", url, self._parse_games_list)
+        if parsed is None: logger.warning(f"Failed to fetch page for URL: {url}"); return [], False, []
+        games, has_next, categories = parsed
         if not games and page > 1: has_next = False; logger.info(f"Games found: {len(games)}, Has next page: {has_next}")
+        logger.info(f"Processed {len(categories)} unique categories."); return games, has_next, categories
+
+    def _parse_games_list(self, html_content: Union[str, bytes]) -> Tuple[List[GameCard], bool, List[Dict[str, str]]]:
+        tree = self._tree_from_html(html_content, _LISTING_PARSER)
+        if tree is None: logger.warning("Failed to build document tree for listing page."); return [], False, []
+        games: List[GameCard] = list(self._iter_game_cards(tree))
+        has_next = any(_NEXT_XPATH(tree))
         categories: List[Dict[str, str]] = []
-        category_elements = soup.select("ul#menu-2nd li.menu-item-object-category a, .sidebar .widget_categories ul li a, .sidebar #categories-3 ul li a")
+        category_elements = _CATEGORIES_XPATH(tree)
         logger.info(f"Found {len(category_elements)} potential category elements.")
         for cat_el in category_elements:
-            cat_name = cat_el.get_text(strip=True); cat_href = self._normalize_url(cat_el.get('href'))
-            if cat_name and cat_href: path_parts = urlparse(cat_href).path.strip('/').split('/'); slug = path_parts[-1] if len(path_parts)>0 and (path_parts[0]=='category' or len(path_parts)==1) else None; categories.append({"name": cat_name, "slug": slug}) if slug else None
+            cat_name = cat_el.text_content().strip(); cat_href = self._normalize_url(cat_el.get('href'))
+            slug_match = _CATEGORY_SLUG_RE.match(cat_href) if cat_name and cat_href else None
+            if slug_match: categories.append({"name": cat_name, "slug": slug_match.group(1)})
         if categories: unique_categories_dict = {item['slug'].lower(): item for item in categories}; categories = sorted(list(unique_categories_dict.values()), key=lambda x: x['name'])
-        logger.info(f"Processed {len(categories)} unique categories."); return games, has_next, categories
+        return games, has_next, categories
 
-    def get_game_details(self, url: str) -> Tuple[Dict[str, Any], Optional[str], Optional[str], List[str], List[Dict[str, Any]], Optional[str], List[Dict[str, Any]]]:
+    def get_game_details(self, url: str) -> Tuple[Dict[str, Any], Optional[str], Optional[str], List[str], List[Dict[str, Any]], Optional[str], List[GameCard]]:
         logger.info(f"Getting game details for: {url}")
-        soup: Optional[BeautifulSoup] = self._get_soup(url)
-        if not soup: return {}, None, None, [], [], None, []
+        parsed = self._cached_parse("details", url, lambda html_content: self._parse_game_details(url, html_content))
+        if parsed is None: return {}, None, None, [], [], None, []
+        return parsed
 
+    def _parse_game_details(self, url: str, html_content: Union[str, bytes]) -> Tuple[Dict[str, Any], Optional[str], Optional[str], List[str], List[Dict[str, Any]], Optional[str], List[GameCard]]:
+        soup: BeautifulSoup = self._soup_from_html(html_content, _DETAIL_STRAINER)
         content_area = soup.select_one("div.post-wrapper, div.post-content, div.entry-content, article.single-post")
-        if not content_area: content_area = soup.body if soup.body else soup
+        if not content_area: # Unfamiliar layout: parse the whole page and fall back to <body>
+            soup = self._soup_from_html(html_content)
+            content_area = soup.body if soup.body else soup
         if not content_area: return {}, None, None, [], [], None, []
 
         meta: Dict[str, Any] = {"url": url, "site": self.site_id}
-        meta["title"] = self._extract_text(content_area, "h1.post-title, h1.entry-title", "Unknown Game"); logger.debug(f"Extracted Title: {meta['title']}")
+        title_el = content_area.find('h1', class_=('post-title', 'entry-title')) # Plain name/class match, no CSS engine
+        meta["title"] = title_el.get_text(strip=True) if title_el else "Unknown Game"; logger.debug(f"Extracted Title: {meta['title']}")
 
         # --- Metadata ---
-        info_text_blob: str = ""
-        potential_info_sources = content_area.find_all(['p', 'div'], recursive=False, limit=10)
-        if not potential_info_sources: potential_info_sources = content_area.find_all(['p', 'div'], limit=15)
-        for source_el in potential_info_sources:
+        blob_parts: List[str] = []; found_labels: Set[str] = set()
+        for source_el in _iter_info_sources(content_area):
             p_text = source_el.get_text(" ", strip=True)
-            if re.search(r'(Title|Genre|Developer|Publisher|Release Date|Mirrors|File Size)\s*:', p_text, re.I): info_text_blob += p_text + "\n"
-            if source_el.find(['h2', 'h3', 'div.wp-tabs', 'div.gallery', 'div.download-links']):
-                 if info_text_blob: break
+            labels = _INFO_LABEL_RE.findall(p_text) if ':' in p_text else None # Every label needs a colon; skip the regex for plain prose
+            if labels: blob_parts.append(p_text); found_labels.update(label.lower() for label in labels)
+            if found_labels.issuperset(_BLOB_META_KEYS): break # Every blob field seen; later blocks cannot change first-hit values
+            if source_el.find(['h2', 'h3']) or source_el.find('div', class_=('wp-tabs', 'gallery', 'download-links')): # Names and classes checked separately; 'div.gallery' as a tag name never matched
+                 if blob_parts: break
+        info_text_blob = "\n".join(blob_parts)
         logger.debug(f"Extracted Info Blob:\n{info_text_blob}")
-        def extract_from_blob(label: str, text_blob: str) -> Optional[str]:
-            match = re.search(rf"{label}\s*:?\s*(.*?)(?:\n|\r|Release Date:|Genre:|Developer:|Publisher:|Mirrors:|File Size:|$)", text_blob, re.I | re.S) # Use DOTALL
-            value = match.group(1).strip().replace('<br>', '').replace('<br/>', '') if match and match.group(1).strip() else None
-            if value and ':' in value and not any(l+':' in value for l in ['http', 'https']): value = value.split(':')[0].strip()
-            return value
-        meta["genre"] = extract_from_blob("Genre", info_text_blob)
-        meta["developer"] = extract_from_blob("Developer", info_text_blob)
-        meta["publisher"] = extract_from_blob("Publisher", info_text_blob)
-        meta["release_date"] = extract_from_blob("Release Date", info_text_blob)
-        # Add File Size and Mirrors if present in the blob
-        meta["file_size"] = extract_from_blob("File Size", info_text_blob)
-        meta["mirrors_text"] = extract_from_blob("Mirrors", info_text_blob) # Store raw text for now
+        blob_fields: Dict[str, Optional[str]] = {}
+        for field_match in _BLOB_FIELD_RE.finditer(info_text_blob): blob_fields.setdefault(_BLOB_META_KEYS[field_match.group(1).lower()], _clean_blob_value(field_match.group(2))) # First occurrence wins
+        for meta_key in _BLOB_META_KEYS.values(): meta[meta_key] = blob_fields.get(meta_key) # Mirrors kept as raw text for now
         logger.debug(f"Extracted Meta: Genre={meta['genre']}, Dev={meta['developer']}, Pub={meta['publisher']}, Date={meta['release_date']}, Size={meta['file_size']}, Mirrors={meta['mirrors_text']}")
 
         # --- Cover Image ---
@@ -94,40 +191,52 @@ class OvaGamesScraper(BaseScraper):
         # --- Initialize ---
         description: Optional[str] = None; sysreq: Optional[str] = None
         screenshots: List[str] = []; downloads: List[Dict[str, Any]] = []
-        password: Optional[str] = None; related_games: List[Dict[str, Any]] = []
+        password: Optional[str] = None; related_games: List[GameCard] = []
+        seen_screenshots: Set[Optional[str]] = {meta.get("image")}; seen_downloads: Set[str] = set() # Set side-tables keep dedupe O(1); the cover is never a screenshot
 
         # --- Try Tab Extraction First ---
         tab_container = soup.select_one("div.wp-tabs, div.tabs-container, div#tabs")
         if tab_container:
             logger.debug("Tab container found. Processing tabs...")
-            desc_panel = tab_container.select_one("#description .wp-tab-content-wrapper"); sysreq_panel = tab_container.select_one("#system_requirements .wp-tab-content-wrapper")
-            screenshot_panel = tab_container.select_one("#screenshot .wp-tab-content-wrapper"); download_panel = tab_container.select_one("#link_download .wp-tab-content-wrapper")
+            def tab_panel(tab_id: str) -> Optional[Tag]:
+                tab_el = tab_container.find(id=tab_id)
+                return tab_el.find(class_='wp-tab-content-wrapper') if tab_el else None
+            desc_panel = tab_panel("description"); sysreq_panel = tab_panel("system_requirements")
+            screenshot_panel = tab_panel("screenshot"); download_panel = tab_panel("link_download")
             if desc_panel: description = desc_panel.get_text("\n", strip=True); logger.debug("Found description in tab.")
             if sysreq_panel: sysreq = sysreq_panel.get_text("\n", strip=True); logger.debug("Found sysreq in tab.")
             if screenshot_panel:
-                 for img_el in screenshot_panel.select("img"): src = img_el.get('data-src') or img_el.get('src'); full_src = self._normalize_url(src); screenshots.append(full_src) if full_src and full_src not in screenshots and full_src != meta.get("image") else None
+                 # dict.fromkeys dedupes in order at C level; the seen-set filter still drops the cover image
+                 tab_srcs = dict.fromkeys(self._normalize_url(img_el.get('data-src') or img_el.get('src')) for img_el in screenshot_panel.find_all("img"))
+                 screenshots.extend(src for src in tab_srcs if src and src not in seen_screenshots); seen_screenshots.update(screenshots)
                  logger.debug(f"Found {len(screenshots)} screenshots in tab.")
             if download_panel:
-                 pwd_box = download_panel.select_one("div.su-box-content");
-                 if pwd_box: pwd_text = pwd_box.get_text(" ",strip=True); pwd_match = re.search(r"(?:Rar |Filecrypt folder )?password\s*:?\s*([\w\.-]+)", pwd_text, re.I); password = pwd_match.group(1) if pwd_match else None
-                 for item_div in download_panel.select(".dl-wraps-item"):
-                     title_tag = item_div.find('b'); title_text = title_tag.get_text(strip=True) if title_tag else "Links"; group = "Update" if "UPDATE" in title_text.upper() else "Main Game"
-                     for link_el in item_div.select("p a[href]"): href = self._normalize_url(link_el.get('href')); text = link_el.get_text(strip=True) or "Download"; downloads.append({"url": href, "text": text, "group": group, "section": title_text}) if href and not any(d['url'] == href for d in downloads) else None
+                 pwd_box = download_panel.find('div', class_='su-box-content')
+                 if pwd_box: pwd_match = self._search_text(pwd_box, _RAR_PWD_RE); password = pwd_match.group(1) if pwd_match else None
+                 for item_div in _TAB_DL_ITEM_SEL.select(download_panel):
+                     title_tag = item_div.find('b'); title_text = title_tag.get_text(strip=True) if title_tag else "Links"; group = "Update" if "update" in title_text.casefold() else "Main Game" # Once per section, not per link
+                     for link_el in _TAB_DL_LINK_SEL.select(item_div):
+                         href = self._normalize_url(link_el.get('href'))
+                         if href and href not in seen_downloads: seen_downloads.add(href); downloads.append({"url": href, "text": link_el.get_text(strip=True) or "Download", "group": group, "section": title_text})
                  logger.debug(f"Found {len(downloads)} downloads in tab. Password: {'Yes' if password else 'No'}")
 
         # --- Fallback/Combined Logic (If tabs missing or need more) ---
         if not description or not sysreq or not downloads or not screenshots:
             logger.info("Tab extraction incomplete or tabs not found, using content flow fallback.")
             # Find potential section start nodes based on H2/H3/Strong tags
-            headers = content_area.find_all(['h2', 'h3', 'strong', 'b'], recursive=True)
-            desc_start, sysreq_start, screen_start, dl_start, install_start = None, None, None, None, None
+            headers = (el for el in content_area.descendants if isinstance(el, Tag) and el.name in _SECTION_HEADER_TAGS) # Lazy, so the walk can stop early
+            section_starts: Dict[str, Tag] = {}
             for h in headers:
-                txt = h.get_text(strip=True).lower()
-                if not desc_start and 'description' in txt: desc_start = h
-                elif not sysreq_start and ('system requirements' in txt or ('minimum' in txt and 'recommended' in txt)): sysreq_start = h
-                elif not screen_start and 'screenshot' in txt: screen_start = h
-                elif not dl_start and ('link download' in txt or 'download links' in txt or 'download link' in txt): dl_start = h
-                elif not install_start and 'install note' in txt: install_start = h
+                keywords = {m.group(0).lower() for m in _HEADER_KEYWORD_RE.finditer(h.get_text(strip=True))} # One scan per header
+                if not keywords: continue
+                kinds = {_HEADER_KEYWORD_SECTION[k] for k in keywords if k in _HEADER_KEYWORD_SECTION}
+                if 'minimum' in keywords and 'recommended' in keywords: kinds.add('sysreq')
+                # A header names the first still-missing section it mentions, in page order of precedence
+                kind = next((k for k in _SECTION_ORDER if k in kinds and k not in section_starts), None)
+                if kind is None: continue
+                section_starts[kind] = h
+                if len(section_starts) == len(_SECTION_ORDER): break # Every section located
+            desc_start, sysreq_start, screen_start, dl_start, install_start = (section_starts.get(k) for k in _SECTION_ORDER)
 
             # Define end markers for extraction
             desc_end = sysreq_start or screen_start or dl_start or install_start
@@ -135,31 +244,26 @@ class OvaGamesScraper(BaseScraper):
             screen_end = dl_start or install_start
             dl_end = install_start
 
-            # Helper to extract text between nodes
-            def extract_between(start_node, end_node, include_tags=['p', 'ul', 'div', 'li', 'pre']):
-                if not start_node: return None
-                parts = []
-                curr = start_node.next_sibling
-                while curr and curr != end_node:
-                    if isinstance(curr, Tag) and curr.name in include_tags: parts.append(curr.get_text("\n", strip=True))
-                    elif not isinstance(curr, Tag) and curr.strip(): parts.append(curr.strip())
-                    curr = curr.next_sibling
+            section_index: Dict[int, Dict[int, int]] = {} # Shared child-position maps for _section_nodes
+
+            # Helper to join the text of a section's sibling nodes
+            def join_section(nodes, include_tags=('p', 'ul', 'div', 'li', 'pre')):
+                parts = [curr.get_text("\n", strip=True) if isinstance(curr, Tag) else curr.strip() for curr in nodes if (curr.name in include_tags if isinstance(curr, Tag) else curr.strip())]
                 return "\n".join(filter(None, parts)).strip() or None
 
             # Extract Description (if not found in tab)
             if not description:
-                start = desc_start or content_area.find('p', string=re.compile(r'free download.*repack pc game', re.I)) # Start after intro para
-                description = extract_between(start, desc_end)
+                start = desc_start or content_area.find('p', string=_INTRO_PARA_RE) # Start after intro para
+                description = join_section(_section_nodes(start, desc_end, section_index)) if start else None
                 if description: logger.debug("Extracted description via fallback.")
 
             # Extract System Requirements (if not found in tab)
             if not sysreq:
-                sysreq = extract_between(sysreq_start, sysreq_end)
                 # Special case for Car Demo: SysReq text might contain links. Extract pure text.
                 if sysreq_start:
+                    sysreq_nodes = _section_nodes(sysreq_start, sysreq_end, section_index)
                     sysreq_content = []
-                    curr = sysreq_start.next_sibling
-                    while curr and curr != sysreq_end:
+                    for curr in sysreq_nodes:
                         if isinstance(curr, Tag) and curr.name in ['p', 'ul', 'div', 'li']:
                              # Get text but exclude the download link text if present
                              temp_text = ""
@@ -170,84 +274,76 @@ class OvaGamesScraper(BaseScraper):
                              if temp_text.strip(): sysreq_content.append(temp_text.strip())
                         elif not isinstance(curr, Tag) and curr.strip():
                             sysreq_content.append(curr.strip())
-                        curr = curr.next_sibling
-                    sysreq = "\n".join(sysreq_content).strip() or sysreq # Overwrite if found this way
+                    sysreq = "\n".join(sysreq_content).strip() or join_section(sysreq_nodes) # Plain section text only if the link-free pass found nothing
 
                 if sysreq: logger.debug("Extracted system reqs via fallback.")
 
             # Extract Screenshots (if not found in tab)
             if not screenshots:
-                area = content_area
-                if screen_start: # Limit search area if header found
-                    temp_soup_str = ""; curr = screen_start.next_sibling
-                    while curr and curr != screen_end: temp_soup_str += str(curr) if isinstance(curr, Tag) else ''; curr = curr.next_sibling
-                    if temp_soup_str: area = BeautifulSoup(f"<div>{temp_soup_str}</div>", "html.parser")
-                for img_el in area.select("img.aligncenter, a[href*='.jpg'] > img, a[href*='.png'] > img"): # Look for common patterns
+                # Limit search area to the section's own tags if header found (matched in place, no reparse)
+                region = [curr for curr in _section_nodes(screen_start, screen_end, section_index) if isinstance(curr, Tag)] if screen_start else []
+                for img_el in (_select_in_nodes(region, _FALLBACK_SHOT_SEL) if region else _FALLBACK_SHOT_SEL.select(content_area)): # Look for common patterns
                      src = img_el.get('src') or img_el.get('data-src') or (img_el.parent.name == 'a' and img_el.parent.get('href'))
-                     if src: full_src = self._normalize_url(src); screenshots.append(full_src) if full_src and full_src not in screenshots and full_src != meta.get("image") else None
+                     if not src: continue
+                     full_src = self._normalize_url(src)
+                     if full_src and full_src not in seen_screenshots: seen_screenshots.add(full_src); screenshots.append(full_src)
                 if screenshots: logger.debug(f"Found {len(screenshots)} screenshots via fallback.")
 
             # Extract Downloads (if not found in tab)
             if not downloads:
-                 area = content_area
-                 if dl_start: # Limit search area
-                      temp_soup_str = ""; curr = dl_start.next_sibling
-                      while curr and curr != dl_end: temp_soup_str += str(curr) if isinstance(curr, Tag) else ''; curr = curr.next_sibling
-                      if temp_soup_str: area = BeautifulSoup(f"<div>{temp_soup_str}</div>", "html.parser")
+                 region = [curr for curr in _section_nodes(dl_start, dl_end, section_index) if isinstance(curr, Tag)] if dl_start else [] # Limit search area
                  # Look for common host links directly in paragraphs or list items
-                 for link_el in area.select("p > a[href], li > a[href]"):
+                 for link_el in (_select_in_nodes(region, _FALLBACK_DL_SEL) if region else _FALLBACK_DL_SEL.select(content_area)):
                      href = self._normalize_url(link_el.get('href'))
                      # Check if previous sibling text looks like a host name (e.g., ✓ MEGA)
                      prev_sib = link_el.find_previous_sibling(string=True)
                      text = link_el.get_text(strip=True) or (prev_sib.strip().lstrip('✓').strip() if prev_sib else "Download")
 
                      # Filter out common non-download links often found here
-                     if href and not any(kw in href for kw in ['#comments', '/faq', '/category/', '/author/']) and not any(d['url'] == href for d in downloads):
-                         downloads.append({"url": href, "text": text, "group": "Downloads", "section": "Links"})
+                     if href and not any(kw in href for kw in ['#comments', '/faq', '/category/', '/author/']) and href not in seen_downloads:
+                         seen_downloads.add(href); downloads.append({"url": href, "text": text, "group": "Downloads", "section": "Links"})
                  if downloads: logger.debug(f"Found {len(downloads)} downloads via fallback.")
 
             # Extract Password (if not found in tab) - search whole content area
             if not password:
                  pwd_box = content_area.select_one("div.su-box-content, .password-box, div[class*='password'], blockquote")
-                 if pwd_box: pwd_match = re.search(r"Password\s*:?\s*([\w.-]+)", pwd_box.get_text(" ", strip=True), re.I); password = pwd_match.group(1) if pwd_match else None
-                 if not password: pwd_match = re.search(r"Password\s*:?\s*([\w.-]+)", content_area.get_text(" ", strip=True), re.I); password = pwd_match.group(1) if pwd_match else None
+                 if pwd_box: pwd_match = self._search_text(pwd_box, _PWD_RE); password = pwd_match.group(1) if pwd_match else None
+                 if not password: pwd_match = self._search_text(content_area, _PWD_RE); password = pwd_match.group(1) if pwd_match else None
                  if password: logger.debug("Found password via fallback.")
 
         # --- Related Games ---
-        # ... (unchanged) ...
-        related_games: List[Dict[str, Any]] = []; related_container = soup.select_one(".related-posts, #yarpp_widget-, .rp4wp-related-posts, div[id*='related']")
+        related_games: List[GameCard] = []; seen_related: Set[str] = set(); related_container = soup.select_one(".related-posts, #yarpp_widget-, .rp4wp-related-posts, div[id*='related']")
         if related_container:
             logger.debug("Related posts container found.")
-            for link_el in related_container.select("a[href]"):
+            meta_title_cf = meta["title"].casefold()
+            for link_el in _RELATED_LINK_SEL.iselect(related_container): # Lazy: anchors past the cap are never matched
                  related_url_raw = link_el.get('href')
-                 if not related_url_raw or related_url_raw == url or not re.search(r'/[a-zA-Z0-9-]+/?$', related_url_raw): continue
-                 related_url = self._normalize_url(related_url_raw);
-                 if not related_url: continue
-                 related_title = link_el.get_text(strip=True); img_tag = link_el.find("img"); related_image = None
-                 if img_tag: img_src_candidate = img_tag.get('data-src') or img_tag.get('src'); related_image = self._normalize_url(img_src_candidate) if img_src_candidate else None
+                 if not related_url_raw or related_url_raw == url or not _REL_SLUG_RE.search(related_url_raw): continue
+                 related_url = self._normalize_url(related_url_raw)
+                 if not related_url or related_url in seen_related: continue # Duplicates skip the title/image work
+                 related_title = link_el.get_text(strip=True); img_tag = link_el.find("img")
                  if not related_title and img_tag and img_tag.get('alt'): related_title = img_tag.get('alt', '')
                  if not related_title: related_title = related_url.strip('/').split('/')[-1].replace('-', ' ').title()
-                 if related_title and related_title.lower() != meta["title"].lower():
-                     if not any(g['url'] == related_url for g in related_games): related_games.append(self._format_game_data(title=related_title, url=related_url, image=related_image))
+                 if not related_title or related_title.casefold() == meta_title_cf: continue
+                 related_image = None
+                 if img_tag: img_src_candidate = img_tag.get('data-src') or img_tag.get('src'); related_image = self._normalize_url(img_src_candidate) if img_src_candidate else None
+                 seen_related.add(related_url); related_games.append(self._format_game_data(title=related_title, url=related_url, image=related_image))
                  if len(related_games) >= 6: break
         logger.info(f"Found {len(related_games)} related games.")
 
         return meta, description, sysreq, screenshots, downloads, password, related_games
 
-    def search_games(self, query: str) -> List[Dict[str, Any]]:
+    def search_games(self, query: str) -> List[GameCard]:
         # ... (unchanged) ...
         if not self.base_url: return []
         search_url = f"{self.base_url}/?s={quote(query)}"; logger.info(f"Searching OvaGames with URL: {search_url}")
-        soup: Optional[BeautifulSoup] = self._get_soup(search_url);
-        if not soup: return []
-        games: List[Dict[str, Any]] = []
-        for game_entry_el in soup.select("div.home-post-wrap"):
-            link_el = game_entry_el.select_one(".home-post-titles h2 a");
-            if not link_el or not link_el.get('href'): continue
-            game_url = self._normalize_url(link_el['href']);
-            if not game_url: continue
-            title = link_el.get_text(strip=True) or "Unknown Title"; img_el = game_entry_el.select_one(".post-inside a img.thumbnail"); image_url: Optional[str] = None
-            if img_el: src_candidate = img_el.get('src') or img_el.get('data-src'); image_url = self._normalize_url(src_candidate) if src_candidate else None
-            games.append(self._format_game_data(title=title, url=game_url, image=image_url))
-            if len(games) >= 20: break
-        logger.info(f"Found {len(games)} results for search query: '{query}'"); return games
\ No newline at end of file
+        games = self._cached_parse("search", search_url, self._parse_search_results)
+        if games is None: return []
+        logger.info(f"Found {len(games)} results for search query: '{query}'"); return games
+
+    def _parse_search_results(self, html_content: Union[str, bytes]) -> List[GameCard]:
+        tree = self._tree_from_html(html_content, _LISTING_PARSER) # Search results share the listing layout
+        return list(islice(self._iter_game_cards(tree), 20)) if tree is not None else []
+
+# Picked up by ScraperFactory discovery without scanning the module
+SCRAPER_CLASS = OvaGamesScraper
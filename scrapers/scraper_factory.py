@@ -4,13 +4,97 @@ Factory for creating scrapers with plugin support.
 import os
 import logging
 import importlib
+import operator
 import pkgutil
+import threading
 from .base_scraper import BaseScraper
-from typing import Dict, Type, List, Any, Optional
+from typing import Dict, Type, List, Any, Optional, Tuple
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Discovery imports and introspects every scraper module; it runs once per process and each
+# factory starts from a copy, so register_scraper stays local to the factory that calls it
+_DISCOVERY_LOCK = threading.Lock()
+_DISCOVERY_CACHE: Optional[Tuple[Dict[str, Type[BaseScraper]], Dict[str, Dict[str, str]]]] = None
+
+def _scan_package() -> Tuple[Dict[str, Type[BaseScraper]], Dict[str, Dict[str, str]]]:
+    """
+    Discover all available scraper plugins in the package.
+    A valid scraper plugin must:
+    1. Be a subclass of BaseScraper
+    2. Have site_id and site_name attributes
+    Returns (scrapers by site_id, site info by site_id).
+    """
+    scrapers: Dict[str, Type[BaseScraper]] = {}
+    site_info: Dict[str, Dict[str, str]] = {}
+    try:
+        # Dynamically import the 'scrapers' package itself to get its path
+        package = importlib.import_module('scrapers')
+        package_path = package.__path__
+    except ImportError:
+        logger.error("Could not import the 'scrapers' package. Scraper discovery will fail.")
+        return scrapers, site_info
+
+    for _, name, _ in pkgutil.iter_modules(package_path, package.__name__ + '.'):
+        if name.endswith('.base_scraper') or name.endswith('.scraper_factory') or name.endswith('.scraper_template'):
+            continue # Skip base, factory, and template modules
+            
+        try:
+            module = importlib.import_module(name)
+            # Modules declare their scraper as SCRAPER_CLASS; scanning every attribute is the fallback
+            declared = getattr(module, 'SCRAPER_CLASS', None)
+            candidates = [(declared.__name__, declared)] if declared is not None else [(attr_name, getattr(module, attr_name)) for attr_name in dir(module)]
+            for attr_name, attr_value in candidates:
+                if (isinstance(attr_value, type) and
+                    issubclass(attr_value, BaseScraper) and
+                    attr_value is not BaseScraper):
+                    
+                    # Use class attributes directly if possible, or instantiate to check
+                    site_id = getattr(attr_value, 'site_id', None)
+                    site_name_val = getattr(attr_value, 'site_name', None)
+
+                    if not site_id or not site_name_val:
+                        # Try instantiating if class attributes are not set (less ideal)
+                        try:
+                            instance = attr_value()
+                            site_id = instance.site_id
+                            site_name_val = instance.site_name
+                        except Exception: # Catch errors during instantiation for this check
+                            logger.debug(f"Could not get site_id/site_name from {attr_name} by instantiation for discovery.")
+                            continue # Skip if still no site_id or site_name
+
+                    if site_id and site_name_val:
+                        if site_id in scrapers:
+                            logger.warning(f"Duplicate site_id '{site_id}' found for scraper {attr_name}. Previous: {scrapers[site_id].__name__}. Overwriting.")
+                        
+                        scrapers[site_id] = attr_value
+                        
+                        site_desc = getattr(attr_value, 'site_description', f"Scraper for {site_name_val}")
+                        
+                        # Remove old entry if site_id is being overwritten, so the new one goes last
+                        site_info.pop(site_id, None)
+                        site_info[site_id] = {
+                            'id': site_id,
+                            'name': site_name_val,
+                            'description': site_desc or f"Scraper for {site_name_val}"
+                        }
+                        logger.info(f"Discovered scraper: {site_id} ({attr_name})")
+                    else:
+                        logger.debug(f"Scraper class {attr_name} in {name} is missing site_id or site_name class attributes.")
+        except ImportError as e:
+            logger.warning(f"Failed to import scraper module {name}: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error discovering scrapers in module {name}: {e}", exc_info=True)
+    return scrapers, site_info
+
+def _discovered_scrapers() -> Tuple[Dict[str, Type[BaseScraper]], Dict[str, Dict[str, str]]]:
+    """Run package discovery once per process (thread-safe) and return the shared result."""
+    global _DISCOVERY_CACHE
+    with _DISCOVERY_LOCK:
+        if _DISCOVERY_CACHE is None: _DISCOVERY_CACHE = _scan_package()
+        return _DISCOVERY_CACHE
+
 class ScraperFactory:
     """
     Factory for creating scrapers with plugin support.
@@ -19,80 +103,30 @@ class ScraperFactory:
     
     def __init__(self) -> None:
         """Initialize the factory and discover available scrapers"""
-        self.scrapers: Dict[str, Type[BaseScraper]] = {}
-        self.site_info: List[Dict[str, str]] = []
+        scrapers, site_info = _discovered_scrapers()
+        self.scrapers: Dict[str, Type[BaseScraper]] = dict(scrapers)
+        self.site_info: Dict[str, Dict[str, str]] = {site_id: dict(info) for site_id, info in site_info.items()} # Keyed by site_id
+        self._site_info_sorted: Optional[List[Dict[str, str]]] = None # get_site_info result; reset by register_scraper
+        # Initialized scrapers keyed by (site_id, cache_dir, cache_timeout); scrapers hold no per-request
+        # state, so reusing them keeps their in-memory parse caches warm across requests
+        self._instances: Dict[Tuple[str, Optional[str], Optional[int]], BaseScraper] = {}
+        self._instances_lock = threading.Lock()
+
+    def _get_instance(self, site_id: str, scraper_class: Type[BaseScraper], cache_dir: Optional[str], cache_timeout: Optional[int]) -> BaseScraper:
+        """Return the shared scraper_class instance for these settings, creating it on first use. Instantiation errors propagate."""
+        key = (site_id, cache_dir, cache_timeout)
+        with self._instances_lock:
+            instance = self._instances.get(key)
+            if instance is None or type(instance) is not scraper_class:
+                # Let BaseScraper use its default timeout if not provided
+                instance = scraper_class(cache_dir=cache_dir, cache_timeout=cache_timeout) if cache_timeout is not None else scraper_class(cache_dir=cache_dir)
+                self._instances[key] = instance
+            return instance
         
-        self._discover_scrapers()
-        
-    def _discover_scrapers(self) -> None:
-        """
-        Discover all available scraper plugins in the package.
-        A valid scraper plugin must:
-        1. Be a subclass of BaseScraper
-        2. Have site_id and site_name attributes
-        """
-        try:
-            # Dynamically import the 'scrapers' package itself to get its path
-            package = importlib.import_module('scrapers')
-            package_path = package.__path__
-        except ImportError:
-            logger.error("Could not import the 'scrapers' package. Scraper discovery will fail.")
-            return
-
-        for _, name, _ in pkgutil.iter_modules(package_path, package.__name__ + '.'):
-            if name.endswith('.base_scraper') or name.endswith('.scraper_factory') or name.endswith('.scraper_template'):
-                continue # Skip base, factory, and template modules
-                
-            try:
-                module = importlib.import_module(name)
-                for attr_name in dir(module):
-                    attr_value = getattr(module, attr_name)
-                    
-                    if (isinstance(attr_value, type) and
-                        issubclass(attr_value, BaseScraper) and
-                        attr_value is not BaseScraper):
-                        
-                        # Use class attributes directly if possible, or instantiate to check
-                        site_id = getattr(attr_value, 'site_id', None)
-                        site_name_val = getattr(attr_value, 'site_name', None)
-
-                        if not site_id or not site_name_val:
-                            # Try instantiating if class attributes are not set (less ideal)
-                            try:
-                                instance = attr_value()
-                                site_id = instance.site_id
-                                site_name_val = instance.site_name
-                            except Exception: # Catch errors during instantiation for this check
-                                logger.debug(f"Could not get site_id/site_name from {attr_name} by instantiation for discovery.")
-                                continue # Skip if still no site_id or site_name
-
-                        if site_id and site_name_val:
-                            if site_id in self.scrapers:
-                                logger.warning(f"Duplicate site_id '{site_id}' found for scraper {attr_name}. Previous: {self.scrapers[site_id].__name__}. Overwriting.")
-                            
-                            self.scrapers[site_id] = attr_value
-                            
-                            site_desc = getattr(attr_value, 'site_description', f"Scraper for {site_name_val}")
-                            
-                            # Remove old entry if site_id is being overwritten
-                            self.site_info = [info for info in self.site_info if info['id'] != site_id]
-                            
-                            self.site_info.append({
-                                'id': site_id,
-                                'name': site_name_val,
-                                'description': site_desc or f"Scraper for {site_name_val}"
-                            })
-                            logger.info(f"Discovered scraper: {site_id} ({attr_name})")
-                        else:
-                            logger.debug(f"Scraper class {attr_name} in {name} is missing site_id or site_name class attributes.")
-            except ImportError as e:
-                logger.warning(f"Failed to import scraper module {name}: {e}")
-            except Exception as e:
-                logger.error(f"Unexpected error discovering scrapers in module {name}: {e}", exc_info=True)
-    
     def get_scraper(self, site_id: str, cache_dir: Optional[str] = None, cache_timeout: Optional[int] = None) -> Optional[BaseScraper]:
         """
         Get an initialized scraper instance for the specified site.
+        Instances are reused across calls with the same cache settings.
 
         Args:
             site_id (str): Site identifier.
@@ -108,11 +142,7 @@ class ScraperFactory:
         scraper_class = self.scrapers.get(site_id)
         if scraper_class:
             try:
-                if cache_timeout is not None:
-                    return scraper_class(cache_dir=cache_dir, cache_timeout=cache_timeout)
-                else:
-                    # Let BaseScraper use its default timeout if not provided
-                    return scraper_class(cache_dir=cache_dir) 
+                return self._get_instance(site_id, scraper_class, cache_dir, cache_timeout)
             except Exception as e:
                 logger.error(f"Failed to instantiate scraper {scraper_class.__name__} for site_id '{site_id}': {e}")
                 return None
@@ -122,7 +152,7 @@ class ScraperFactory:
 
     def get_all_scrapers(self, cache_dir: Optional[str] = None, cache_timeout: Optional[int] = None) -> Dict[str, BaseScraper]:
         """
-        Get all available initialized scraper instances.
+        Get all available initialized scraper instances (shared as in get_scraper).
 
         Args:
             cache_dir (str, optional): Directory to cache responses.
@@ -134,12 +164,7 @@ class ScraperFactory:
         initialized_scrapers: Dict[str, BaseScraper] = {}
         for site_id, scraper_class in self.scrapers.items():
             try:
-                instance: Optional[BaseScraper]
-                if cache_timeout is not None:
-                    instance = scraper_class(cache_dir=cache_dir, cache_timeout=cache_timeout)
-                else:
-                    instance = scraper_class(cache_dir=cache_dir)
-                
+                instance: Optional[BaseScraper] = self._get_instance(site_id, scraper_class, cache_dir, cache_timeout)
                 if instance:
                     initialized_scrapers[site_id] = instance
             except Exception as e:
@@ -154,8 +179,9 @@ class ScraperFactory:
         Returns:
             list: List of site information dictionaries.
         """
-        # Sort site_info by name for consistent display
-        return sorted(self.site_info, key=lambda x: x['name'])
+        # Sort site_info by name for consistent display; sorted once, then only after a registration
+        if self._site_info_sorted is None: self._site_info_sorted = sorted(self.site_info.values(), key=operator.itemgetter('name'))
+        return list(self._site_info_sorted)
         
     def register_scraper(self, scraper_class: Type[BaseScraper]) -> bool:
         """
@@ -191,12 +217,13 @@ class ScraperFactory:
                 site_desc = getattr(scraper_class, 'site_description', f"Scraper for {site_name_val}")
 
                 # Update site_info: remove old if exists, then add new
-                self.site_info = [info for info in self.site_info if info['id'] != site_id]
-                self.site_info.append({
+                self.site_info.pop(site_id, None)
+                self.site_info[site_id] = {
                     'id': site_id,
                     'name': site_name_val,
                     'description': site_desc or f"Scraper for {site_name_val}"
-                })
+                }
+                self._site_info_sorted = None
                 logger.info(f"Manually registered scraper: {site_id} ({scraper_class.__name__})")
                 return True
             else:
@@ -2,7 +2,38 @@
 Template for creating a new scraper plugin.
 Copy this file and modify it to create a new scraper for a game site.
 """
-from .base_scraper import BaseScraper
+import re
+import sys
+from urllib.parse import quote_plus
+import soupsieve as sv
+from bs4 import SoupStrainer
+from lxml import etree
+from .base_scraper import BaseScraper, UTF8_HTML_PARSER, xpath_has_class
+
+# Listing pages are walked as an lxml tree with precompiled XPath: the per-entry lookups in the
+# hot loop run in libxml2 instead of soupsieve (Replace with actual classes)
+_GAME_ENTRY_XPATH = etree.XPath(f"//*[{xpath_has_class('game-entry')}]")
+_TITLE_XPATH = etree.XPath(f"(.//*[{xpath_has_class('title')}])[1]")
+_GAME_LINK_XPATH = etree.XPath(f"(.//a[{xpath_has_class('game-link')}])[1]")
+_THUMBNAIL_XPATH = etree.XPath(f"(.//img[{xpath_has_class('thumbnail')}])[1]")
+_DESCRIPTION_XPATH = etree.XPath(f"(.//*[{xpath_has_class('description')}])[1]")
+_NEXT_PAGE_XPATH = etree.XPath(f"(//*[{xpath_has_class('pagination')}]//*[{xpath_has_class('next')}])[1]")
+_CATEGORY_LINK_XPATH = etree.XPath(f"//*[{xpath_has_class('categories')}]//a")
+
+# Selectors are compiled once at import time and reused on every call (Replace with actual selectors)
+_SCREENSHOT_SEL = sv.compile('.screenshots img')
+_DOWNLOAD_LINK_SEL = sv.compile('.download-links a')
+_RELATED_GAME_SEL = sv.compile('.related-games .game')
+# The three detail-page lists above in one selector, so the page is walked once for all of them
+_DETAIL_LISTS_SEL = sv.compile('.screenshots img, .download-links a, .related-games .game')
+_SEARCH_RESULT_SEL = sv.compile('.search-results .game')
+
+# OPTIONAL: only build the parts of each page you read; everything else (headers, ads, comments...) is skipped.
+# Match whole class tokens; list every class the method reads (Replace with actual classes)
+_SEARCH_STRAINER = SoupStrainer(class_=re.compile(r'(^|\s)(search-results)(\s|$)'))
+_DETAIL_STRAINER = SoupStrainer(class_=re.compile(
+    r'(^|\s)(game-title|game-description|game-cover|release-date|developer|publisher|genres|system-requirements'
+    r'|screenshots|download-links|download-password|related-games)(\s|$)'))
 
 class TemplateScraper(BaseScraper):
     """
@@ -46,19 +77,43 @@ class TemplateScraper(BaseScraper):
         else:
             url = f"{self.base_url}/page/{page}"
             
-        # Get the HTML
-        soup = self._get_soup(url)
+        # Fetch and parse the page. _cached_parse reuses the parsed result while the page
+        # content is unchanged (in memory, then as a pickle under cache_dir)
+        parsed = self._cached_parse("games_list", url, lambda html_content: self._parse_games_list(html_content, page))
+        if parsed is None:
+            return [], False, []
+        return parsed
+    
+    def _parse_games_list(self, html_content, page=1):
+        """
+        Parse a games list page into (games, has_next, categories), see get_games_list.
+        Results are cached and shared between calls, so return fresh objects and never mutate them later.
+        """
+        # Build an lxml tree from the fetched UTF-8 HTML (None if the markup is empty or unparseable).
+        # A custom lxml parser passed here must be built with encoding='utf-8'
+        tree = self._tree_from_html(html_content, UTF8_HTML_PARSER)
+        if tree is None:
+            return [], False, []
         
         # Example of parsing game entries
         games = []
-        game_elements = soup.select('.game-entry')  # Replace with actual selector
+        game_elements = _GAME_ENTRY_XPATH(tree)
+        
+        # Past the last page (or a bad category): nothing to list and nowhere to go next.
+        # Page 1 still reports its categories so the user can navigate away
+        if not game_elements and page > 1:
+            return [], False, []
         
         for element in game_elements:
-            # Extract information about each game
-            title = self._extract_text(element, '.title')
-            link = self._extract_link(element, 'a.game-link')
-            image = self._extract_image(element, 'img.thumbnail')
-            description = self._extract_text(element, '.description', '')
+            # Extract information about each game; each XPath returns at most one element
+            title_els = _TITLE_XPATH(element)
+            link_els = _GAME_LINK_XPATH(element)
+            image_els = _THUMBNAIL_XPATH(element)
+            description_els = _DESCRIPTION_XPATH(element)
+            title = title_els[0].text_content().strip() if title_els else ''
+            link = self._normalize_url(link_els[0].get('href')) if link_els else None
+            image = self._normalize_url(image_els[0].get('src')) if image_els else None
+            description = description_els[0].text_content().strip() if description_els else ''
             
             # Add to games list with consistent format
             games.append(self._format_game_data(
@@ -68,23 +123,24 @@ class TemplateScraper(BaseScraper):
                 description=description
             ))
         
-        # Check if there's a next page
-        next_button = soup.select_one('.pagination .next')  # Replace with actual selector
-        has_next = next_button is not None
+        # Check if there's a next page (first match only; a page without games has none)
+        has_next = bool(game_elements) and bool(_NEXT_PAGE_XPATH(tree))
         
         # Get categories if available
         categories = []
-        category_elements = soup.select('.categories a')  # Replace with actual selector
+        category_elements = _CATEGORY_LINK_XPATH(tree)
         
         for element in category_elements:
-            category_name = element.get_text(strip=True)
+            category_name = element.text_content().strip()
             category_link = element.get('href', '')
             if category_link:
                 # Extract category identifier from URL
-                category_id = category_link.split('/')[-1]
+                category_id = category_link.rpartition('/')[2]  # Last path segment, without building a list
+                # Category and genre labels repeat on every page; interning keeps one shared copy
+                # of each in cached results instead of a new string per page
                 categories.append({
-                    'id': category_id,
-                    'name': category_name
+                    'id': sys.intern(category_id),
+                    'name': sys.intern(category_name)
                 })
         
         return games, has_next, categories
@@ -106,8 +162,18 @@ class TemplateScraper(BaseScraper):
                 password (str): Download password
                 related (list): List of related games
         """
-        # Get the HTML
-        soup = self._get_soup(url)
+        # Fetch and parse the page, reusing the cached result for unchanged pages (see get_games_list)
+        parsed = self._cached_parse("details", url, lambda html_content: self._parse_game_details(url, html_content))
+        if parsed is None:
+            return {}, None, None, [], [], None, []
+        return parsed
+    
+    def _parse_game_details(self, url, html_content):
+        """
+        Parse a game page into the get_game_details tuple. Results are cached, as in _parse_games_list.
+        """
+        # Build the soup from the fetched HTML
+        soup = self._soup_from_html(html_content, parse_only=_DETAIL_STRAINER)
         
         # Extract metadata
         meta = {
@@ -115,7 +181,7 @@ class TemplateScraper(BaseScraper):
             'release_date': self._extract_text(soup, '.release-date', None),
             'developer': self._extract_text(soup, '.developer', None),
             'publisher': self._extract_text(soup, '.publisher', None),
-            'genres': [g.strip() for g in self._extract_text(soup, '.genres', '').split(',') if g.strip()],
+            'genres': [sys.intern(g) for g in map(str.strip, self._extract_text(soup, '.genres', '').split(',')) if g],
             'image': self._extract_image(soup, '.game-cover'),
             'url': url,
             'site': self.site_id
@@ -127,22 +193,38 @@ class TemplateScraper(BaseScraper):
         # Extract system requirements
         sysreq = self._extract_text(soup, '.system-requirements')
         
-        # Extract screenshots
+        # Collect screenshot, download and related-game elements in a single walk over the page;
+        # each hit is routed to its list(s) by the selector it matches, keeping document order
+        screenshot_elements = []
+        download_elements = []
+        related_elements = []
+        for element in _DETAIL_LISTS_SEL.select(soup):
+            if _SCREENSHOT_SEL.match(element):
+                screenshot_elements.append(element)
+            if _DOWNLOAD_LINK_SEL.match(element):
+                download_elements.append(element)
+            if _RELATED_GAME_SEL.match(element):
+                related_elements.append(element)
+        
+        # Extract screenshots (sites often repeat an image, e.g. thumbnail + full size; keep the first)
         screenshots = []
-        screenshot_elements = soup.select('.screenshots img')  # Replace with actual selector
+        seen_screenshots = set()
         for element in screenshot_elements:
             if element.get('src'):
-                screenshot_url = element['src']
-                if not screenshot_url.startswith(('http://', 'https://')):
-                    screenshot_url = urljoin(self.base_url, screenshot_url)
-                screenshots.append(screenshot_url)
+                # Absolute URLs pass straight through; relative ones are joined with base_url once
+                # and memoized per scraper (pages repeat the same paths)
+                screenshot_url = self._normalize_url(element['src'])
+                if screenshot_url not in seen_screenshots:
+                    seen_screenshots.add(screenshot_url)
+                    screenshots.append(screenshot_url)
         
-        # Extract download links
+        # Extract download links (one entry per URL, first one wins)
         downloads = []
-        download_elements = soup.select('.download-links a')  # Replace with actual selector
+        seen_downloads = set()
         for element in download_elements:
-            if element.get('href'):
+            if element.get('href') and element['href'] not in seen_downloads:
                 link_url = element['href']
+                seen_downloads.add(link_url)
                 link_text = element.get_text(strip=True)
                 downloads.append({
                     'url': link_url,
@@ -154,7 +236,6 @@ class TemplateScraper(BaseScraper):
         
         # Extract related games
         related = []
-        related_elements = soup.select('.related-games .game')  # Replace with actual selector
         for element in related_elements:
             title = self._extract_text(element, '.title')
             link = self._extract_link(element, 'a')
@@ -178,15 +259,27 @@ class TemplateScraper(BaseScraper):
         Returns:
             list: List of game dictionaries
         """
-        # Construct search URL
-        search_url = f"{self.base_url}/search?q={query}"
+        # Construct search URL: collapse stray whitespace so equivalent queries share one URL
+        # (and one cache entry), and encode it so spaces, '&' or '#' cannot break the query string
+        query = " ".join(query.split())
+        search_url = f"{self.base_url}/search?q={quote_plus(query)}"
         
-        # Get HTML
-        soup = self._get_soup(search_url)
+        # Fetch and parse the page, reusing the cached result for unchanged pages (see get_games_list)
+        games = self._cached_parse("search", search_url, self._parse_search_results)
+        if games is None:
+            return []
+        return games
+    
+    def _parse_search_results(self, html_content):
+        """
+        Parse a search results page into a list of games. Results are cached, as in _parse_games_list.
+        """
+        # Build the soup from the fetched HTML
+        soup = self._soup_from_html(html_content, parse_only=_SEARCH_STRAINER)
         
         # Parse search results
         games = []
-        result_elements = soup.select('.search-results .game')  # Replace with actual selector
+        result_elements = _SEARCH_RESULT_SEL.select(soup)
         
         for element in result_elements:
             title = self._extract_text(element, '.title')
@@ -201,4 +294,7 @@ class TemplateScraper(BaseScraper):
                 description=description
             ))
         
-        return games 
\ No newline at end of file
+        return games
+
+# OPTIONAL: declare your scraper class for discovery; without it the factory scans every module attribute
+SCRAPER_CLASS = TemplateScraper